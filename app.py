@@ -1,14 +1,43 @@
 import os
+import re
 import json
+import sqlite3
+import hashlib
+import heapq
+import base64
+import statistics
+import uuid
+import queue
+import socket
+import collections
+import contextlib
+import gzip
 import requests
-from flask import Flask, render_template, request, redirect, url_for, flash, session, g, jsonify
+from requests.adapters import HTTPAdapter
+from flask import Flask, render_template, request, redirect, url_for, flash, session, g, jsonify, Response, has_app_context
 from werkzeug.utils import secure_filename
 from openai import OpenAI
 import google.generativeai as genai
 import feedparser
-from datetime import datetime
+from datetime import datetime, timezone
 import threading
 import time
+import calendar
+import xml.etree.ElementTree as ET
+from email.utils import formatdate, parsedate_to_datetime
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+try:
+    import fcntl
+except ImportError:  # Windows: config writes are only serialized within one process
+    fcntl = None
+try:
+    import brotli
+except ImportError:  # Optional; responses are gzip-compressed without it
+    brotli = None
 
 # --- App Configuration ---
 app = Flask(__name__)
@@ -16,6 +45,37 @@ app.config['SECRET_KEY'] = 'your-very-secret-key' # Replace with a real secret k
 app.config['UPLOAD_FOLDER'] = 'static/uploads'
 app.config['CONFIG_FILE'] = 'config.json'
 app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'gif', 'svg'}
+app.config['RSS_REFRESH_INTERVAL'] = 300 # Default seconds between polls of a feed
+app.config['RSS_MIN_POLL_INTERVAL'] = 120 # Fastest a frequently updated feed is polled
+app.config['RSS_MAX_POLL_INTERVAL'] = 6 * 3600 # Slowest a rarely updated feed is polled
+app.config['RSS_MAX_BACKOFF'] = 3600 # Longest retry delay for a failing feed
+app.config['RSS_CIRCUIT_THRESHOLD'] = 5 # Consecutive failures before a feed's circuit opens
+app.config['RSS_CIRCUIT_COOLDOWN'] = 6 * 3600 # Seconds an open circuit waits before retrying
+app.config['RSS_MAX_STALENESS'] = 24 * 3600 # Oldest cached copy of a feed that is served without refetching
+app.config['RSS_MAX_WORKERS'] = 8 # Maximum number of feeds fetched concurrently
+app.config['RSS_FETCH_DEADLINE'] = 10 # Seconds a refresh job waits for all feeds
+app.config['RSS_REQUEST_DEADLINE'] = 3 # Seconds a request waits for uncached feeds
+app.config['RSS_MIN_TTL'] = 60 # Seconds a fetched feed is reused before it may be fetched again
+app.config['RSS_USER_AGENT'] = 'Dashboard RSS Reader'
+app.config['RSS_CONNECT_TIMEOUT'] = 5 # Seconds allowed to connect to a feed server
+app.config['RSS_READ_TIMEOUT'] = 10 # Seconds allowed between bytes, and for the whole body
+app.config['RSS_MAX_BYTES'] = 2 * 1024 * 1024 # Largest feed document that will be downloaded
+app.config['RSS_ENTRY_LIMIT'] = 5 # Entries kept per feed; parsing stops once this many are read
+app.config['RSS_PARSE_PROCESSES'] = 0 # Worker processes for feed parsing; 0 parses in the fetch thread
+app.config['RSS_IMPORT_CONCURRENCY'] = 8 # Feeds validated at once when added from the settings page, e.g. during an OPML import
+app.config['RSS_IMPORT_DEADLINE'] = 10 # Seconds an OPML import waits for validation; slower feeds are added as pending
+app.config['RSS_EVENT_HEARTBEAT'] = 15 # Seconds between keep-alive comments on idle event streams
+app.config['RSS_EVENT_BACKLOG'] = 256 # Recent events kept for replay to reconnecting dashboards
+app.config['RSS_EVENT_STREAMS'] = True # Push feed updates over /api/events; needs a threaded or gevent server, as each dashboard holds a request open
+app.config['RSS_EVENT_MAX_SUBSCRIBERS'] = 32 # Event streams one process keeps open; further dashboards poll instead
+app.config['CONFIG_BACKEND'] = 'json' # 'json' for config.json plus journal, 'sqlite' for CONFIG_DB
+app.config['CONFIG_DB'] = 'config.db' # SQLite file holding groups, links and feeds when CONFIG_BACKEND is 'sqlite'
+app.config['CONFIG_COMPACT_RECORDS'] = 200 # Journaled config changes kept before they are folded into config.json
+app.config['CONFIG_BATCH_LIMIT'] = 1000 # Operations accepted in one /api/batch request
+app.config['ARTICLE_DB'] = 'articles.db' # SQLite file holding fetched articles and feed state
+app.config['ARTICLE_RETENTION_DAYS'] = 90 # Articles older than this are pruned from the store
+app.config['COMPRESS_MIN_SIZE'] = 1024 # Smallest response body, in bytes, that is compressed
+app.config['COMPRESS_LEVEL'] = 6 # gzip level and brotli quality for compressed responses
 
 # --- Helper Functions ---
 
@@ -24,75 +84,2586 @@ def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
+def entry_timestamp(entry, default=None):
+    """Returns the publication time of a feedparser entry as a UNIX timestamp."""
+    for attr in ('published_parsed', 'updated_parsed'):
+        parsed = getattr(entry, attr, None)
+        if parsed:
+            try:
+                return calendar.timegm(parsed[:6] + (0, 0, 0))
+            except (TypeError, ValueError, OverflowError):
+                pass
+    return default if default is not None else time.time()
+
+# Shared HTTP session so feed fetches reuse pooled keep-alive connections.
+rss_session = requests.Session()
+rss_session.headers['User-Agent'] = app.config['RSS_USER_AGENT']
+rss_session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=app.config['RSS_MAX_WORKERS']))
+rss_session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=app.config['RSS_MAX_WORKERS']))
+
+# Last ETag / Last-Modified seen for each feed URL, sent back on the next poll.
+feed_validators = {}
+feed_validators_lock = threading.Lock()
+
+def feed_fetch_limits(options=None):
+    """Returns (connect_timeout, read_timeout, max_bytes) for a feed.
+
+    Values stored on the feed's entry in config['rss_feeds'] override the
+    application defaults.
+    """
+    options = options or {}
+    return (float(options.get('connect_timeout') or app.config['RSS_CONNECT_TIMEOUT']),
+            float(options.get('read_timeout') or app.config['RSS_READ_TIMEOUT']),
+            int(options.get('max_bytes') or app.config['RSS_MAX_BYTES']))
+
+def response_socket(response):
+    """Returns the socket a streamed response body is read from, or None if it cannot be found.
+
+    http.client drops the connection's reference to the socket for bodies
+    that end when the server closes, but the body's reader keeps its own.
+    """
+    reader = getattr(getattr(response.raw, '_original_response', None), 'fp', None)
+    sock = getattr(getattr(reader, 'raw', None), '_sock', None)
+    if sock is None:
+        sock = getattr(getattr(response.raw, '_connection', None), 'sock', None)
+    return sock
+
+def abort_download(sock):
+    """Shuts a socket down so a read blocked on it in another thread returns at once.
+
+    The socket is never closed here: its file descriptor could be reused while
+    the reading thread is still using it.
+    """
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+@contextlib.contextmanager
+def download_deadline(response, deadline):
+    """Aborts the download of `response` if it is still running at `deadline`.
+
+    The read timeout only bounds each socket read, so a server trickling a
+    byte at a time could otherwise hold the download open indefinitely.
+    """
+    sock = response_socket(response)
+    if sock is None:
+        print(f"Warning: cannot enforce the download deadline for {response.url}")
+        yield
+        return
+    timer = threading.Timer(max(deadline - time.monotonic(), 0), abort_download, (sock,))
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+
+def iter_feed_chunks(response, max_bytes, deadline):
+    """Yields a streamed response body, aborting past max_bytes or the deadline."""
+    content_length = response.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise ValueError(f"feed is {content_length} bytes, limit is {max_bytes}")
+
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=16 * 1024):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"feed exceeds the {max_bytes} byte limit")
+            if time.monotonic() > deadline:
+                raise TimeoutError("feed download took too long")
+            yield chunk
+    except requests.RequestException as e:
+        if time.monotonic() > deadline:
+            raise TimeoutError("feed download took too long") from e
+        raise
+    # download_deadline() ends an aborted body early, which must not pass for the whole document
+    if time.monotonic() > deadline:
+        raise TimeoutError("feed download took too long")
+
+class TextExtractor(HTMLParser):
+    """Collects the text content of an HTML fragment, leaving out scripts and style sheets.
+
+    The text has entities decoded, so it may itself look like markup; the
+    dashboard escapes it before display.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self.skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self.skipping:
+            self.skipping -= 1
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.parts.append(data)
+
+def http_link(url):
+    """Returns `url` if it is an http(s) URL, otherwise an empty string."""
+    url = (url or '').strip()
+    return url if urlparse(url).scheme in ('http', 'https') else ''
+
+def strip_html(value):
+    """Reduces an HTML fragment to its text content."""
+    if not value or '<' not in value and '&' not in value:
+        return value or ''
+    extractor = TextExtractor()
+    extractor.feed(value)
+    extractor.close()
+    return ''.join(extractor.parts)
+
+SUMMARY_LENGTH = 150 # Characters of plain text kept as an entry's summary
+
+def summarize_html(value, length=SUMMARY_LENGTH):
+    """Reduces an HTML fragment to plain text of at most `length` characters.
+
+    Entities are decoded, so the text must be escaped wherever it is shown.
+
+    Whitespace is collapsed and long text is cut on a word boundary. Only as
+    much of the fragment is parsed as is needed to fill the summary, so full
+    article bodies in content:encoded stay cheap.
+    """
+    if not value:
+        return ''
+    if '<' not in value and '&' not in value:
+        text = ' '.join(value[:length * 4].split())
+    else:
+        extractor = TextExtractor()
+        for start in range(0, len(value), 4096):
+            extractor.feed(value[start:start + 4096])
+            if len(' '.join(''.join(extractor.parts).split())) > length:
+                break
+        extractor.close()
+        text = ' '.join(''.join(extractor.parts).split())
+
+    if len(text) <= length:
+        return text
+    cut = text.rfind(' ', 0, length + 1)
+    if cut < length // 2:
+        # A single very long word; cut it rather than drop most of the summary
+        cut = length
+    return text[:cut].rstrip(' .,;:-') + '...'
+
+def parse_feed_timestamp(value):
+    """Parses an RFC 822 or ISO 8601 date string into a UNIX timestamp."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        return calendar.timegm(parsed.timetuple())
+    return parsed.timestamp()
+
+def entry_guid(guid, link, title, published):
+    """Returns a stable identifier for an entry, derived from its content if it has no GUID."""
+    if guid:
+        return guid.strip()
+    if link:
+        return link
+    return hashlib.sha1(f"{title}\n{published}".encode('utf-8')).hexdigest()
+
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+def parse_rss_ttl(value):
+    """Converts an RSS <ttl> value in minutes into seconds."""
+    try:
+        return int(value.strip()) * 60 if value else None
+    except (AttributeError, ValueError):
+        return None
+
+def http_freshness_lifetime(headers):
+    """Returns how many seconds an HTTP response stays fresh per Cache-Control/Expires, or None."""
+    cache_control = headers.get('Cache-Control', '').lower()
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return 0
+    match = re.search(r'max-age\s*=\s*(\d+)', cache_control)
+    if match:
+        age = headers.get('Age', '0')
+        return max(int(match.group(1)) - (int(age) if age.isdigit() else 0), 0)
+    if headers.get('Expires'):
+        try:
+            expires = parsedate_to_datetime(headers['Expires']).timestamp()
+            date = parsedate_to_datetime(headers['Date']).timestamp() if headers.get('Date') else time.time()
+        except (TypeError, ValueError, IndexError):
+            return 0
+        return max(int(expires - date), 0)
+    return None
+
+# Namespace-stripped element names understood by the incremental parser.
+FEED_CONTAINERS = {'channel', 'feed'}
+FEED_ITEMS = {'item', 'entry'}
+FEED_SUMMARY_FIELDS = ('summary', 'description', 'content', 'encoded')
+FEED_DATE_FIELDS = ('pubDate', 'published', 'updated', 'date')
+
+def local_name(tag):
+    """Strips the namespace from an ElementTree tag."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+def element_link(element):
+    """Returns the URL of an RSS <link> or an alternate Atom <link href>."""
+    if element.get('href') is not None:
+        if element.get('rel', 'alternate') == 'alternate':
+            return element.get('href')
+        return None
+    return (element.text or '').strip() or None
+
+def parse_feed_incremental(chunks, feed_url, fetched_at, limit):
+    """Parses an RSS or Atom document from byte chunks, stopping after `limit` items.
+
+    Only the channel metadata and the first `limit` items are read; the rest of
+    the document (and of the download) is never touched. Raises ET.ParseError if
+    the document is not well-formed so the caller can fall back to feedparser.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    channel = {}
+    entries = []
+    depth = 0
+    container_depth = None
+    item = None
+    item_depth = None
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            name = local_name(element.tag)
+            if event == 'start':
+                depth += 1
+                if item is None and name in FEED_ITEMS:
+                    item, item_depth = {}, depth
+                elif container_depth is None and name in FEED_CONTAINERS:
+                    container_depth = depth
+                continue
+
+            if item is not None and depth == item_depth:
+                entries.append(item)
+                item = None
+                element.clear()
+                if len(entries) >= limit:
+                    return build_incremental_feed(channel, entries, feed_url, fetched_at)
+            elif item is not None and depth == item_depth + 1:
+                if name == 'link':
+                    if element_link(element):
+                        item.setdefault('link', element_link(element))
+                else:
+                    item.setdefault(name, ''.join(element.itertext()))
+            elif item is None and container_depth is not None and depth == container_depth + 1:
+                if name == 'link':
+                    if element_link(element):
+                        channel.setdefault('link', element_link(element))
+                elif name in ('skipHours', 'skipDays'):
+                    channel[name] = [(child.text or '').strip() for child in element]
+                else:
+                    channel.setdefault(name, ''.join(element.itertext()))
+            depth -= 1
+
+    parser.close()
+    return build_incremental_feed(channel, entries, feed_url, fetched_at)
+
+def build_incremental_feed(channel, items, feed_url, fetched_at):
+    """Shapes the raw fields collected by parse_feed_incremental() like fetch_rss_feed() output."""
+    feed_data = {
+        'title': strip_html(channel.get('title', '')).strip() or 'Unknown Feed',
+        'link': http_link(urljoin(feed_url, channel.get('link', ''))) or feed_url,
+        'description': strip_html(channel.get('description') or channel.get('subtitle') or ''),
+        'entries': [],
+        'fetched_at': fetched_at,
+        'ttl': parse_rss_ttl(channel.get('ttl')),
+        'skip_hours': sorted({int(hour) for hour in channel.get('skipHours', []) if hour.isdigit() and int(hour) < 24}),
+        'skip_days': sorted({day.capitalize() for day in channel.get('skipDays', []) if day.capitalize() in WEEKDAYS}),
+        'bozo': None
+    }
+    for item in items:
+        summary = next((summarize_html(item[field]) for field in FEED_SUMMARY_FIELDS if item.get(field)), '')
+        published = next((item[field].strip() for field in FEED_DATE_FIELDS if item.get(field)), '')
+        title = strip_html(item.get('title', '')).strip() or 'Untitled'
+        link = http_link(urljoin(feed_url, item['link'])) if item.get('link') else ''
+        feed_data['entries'].append({
+            'guid': entry_guid(item.get('guid') or item.get('id'), link, title, published),
+            'title': title,
+            'link': link,
+            'summary': summary,
+            'published': published,
+            'timestamp': parse_feed_timestamp(published) or fetched_at
+        })
+    return feed_data
+
+def parse_feed_fallback(content, content_type, feed_url, fetched_at, limit):
+    """Parses a complete document with feedparser, which tolerates malformed feeds."""
+    feed = feedparser.parse(content, response_headers={
+        'content-type': content_type,
+        'content-location': feed_url
+    })
+    if feed.bozo:
+        print(f"Warning: RSS feed {feed_url} has malformed XML")
+    
+    feed_data = {
+        'title': getattr(feed.feed, 'title', 'Unknown Feed'),
+        'link': http_link(getattr(feed.feed, 'link', '')) or feed_url,
+        'description': strip_html(getattr(feed.feed, 'description', '')),
+        'entries': [],
+        'fetched_at': fetched_at,
+        'ttl': parse_rss_ttl(feed.feed.get('ttl')),
+        'skip_hours': [],
+        'skip_days': [],
+        'bozo': str(feed.get('bozo_exception', 'malformed feed')) if feed.bozo else None
+    }
+    
+    for entry in feed.entries[:limit]:
+        entry_data = {
+            'guid': entry_guid(getattr(entry, 'id', ''), getattr(entry, 'link', ''),
+                               getattr(entry, 'title', ''), getattr(entry, 'published', '')),
+            'title': getattr(entry, 'title', 'Untitled'),
+            'link': http_link(getattr(entry, 'link', '')),
+            'summary': summarize_html(entry.get('summary') or entry.get('description')),
+            'published': getattr(entry, 'published', ''),
+            'timestamp': entry_timestamp(entry, fetched_at)
+        }
+        feed_data['entries'].append(entry_data)
+    
+    return feed_data
+
+def parse_feed_document(content, content_type, feed_url, fetched_at, limit):
+    """Parses a complete feed document, falling back to feedparser if it is malformed.
+
+    This is the unit of work handed to the parse process pool, so it only takes
+    and returns plain picklable values.
+    """
+    chunk_size = 16 * 1024
+    chunks = (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+    try:
+        return parse_feed_incremental(chunks, feed_url, fetched_at, limit)
+    except ET.ParseError:
+        return parse_feed_fallback(content, content_type, feed_url, fetched_at, limit)
+
+rss_parse_pool = None
+rss_parse_pool_lock = threading.Lock()
+
+def get_rss_parse_pool():
+    """Returns the feed parsing process pool, or None when parsing runs in-thread."""
+    global rss_parse_pool
+    if not app.config['RSS_PARSE_PROCESSES']:
+        return None
+    with rss_parse_pool_lock:
+        if rss_parse_pool is None:
+            rss_parse_pool = ProcessPoolExecutor(max_workers=app.config['RSS_PARSE_PROCESSES'],
+                                                 mp_context=multiprocessing.get_context('spawn'))
+        return rss_parse_pool
+
+def discard_rss_parse_pool(pool):
+    """Drops a broken parse pool so the next fetch starts a fresh one."""
+    global rss_parse_pool
+    with rss_parse_pool_lock:
+        if rss_parse_pool is pool:
+            rss_parse_pool = None
+    pool.shutdown(wait=False)
+
+def fetch_rss_feed(feed_url, cached=None, options=None):
+    """Fetches RSS feed and returns parsed data.
+
+    If a previous result is passed as `cached`, the request is made conditional
+    on the validators remembered for the feed and a 304 response returns that
+    result again without parsing anything. `options` is the feed's config entry,
+    which may override the timeouts and size limit.
+
+    The body is parsed incrementally while it downloads and the connection is
+    dropped as soon as RSS_ENTRY_LIMIT items have been read. Documents that are
+    not well-formed XML are read in full and handed to feedparser instead.
+    When RSS_PARSE_PROCESSES is set, the body is downloaded in full here and
+    parsed in a worker process to keep CPU-bound parsing off the GIL.
+
+    Network, HTTP and size-limit errors are raised to the caller.
+    """
+    connect_timeout, read_timeout, max_bytes = feed_fetch_limits(options)
+    limit = app.config['RSS_ENTRY_LIMIT']
+    headers = {}
+    if cached is not None:
+        with feed_validators_lock:
+            validators = feed_validators.get(feed_url, {})
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    deadline = time.monotonic() + connect_timeout + read_timeout
+    with rss_session.get(feed_url, headers=headers, stream=True,
+                         timeout=(connect_timeout, read_timeout)) as response:
+        fetched_at = time.time()
+        http_max_age = http_freshness_lifetime(response.headers)
+        if response.status_code == 304 and cached is not None:
+            return dict(cached, fetched_at=fetched_at, http_max_age=http_max_age)
+        response.raise_for_status()
+
+        # Remembered only once the body has been parsed, or a failed download would be revalidated as current
+        response_validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        content_type = response.headers.get('Content-Type', '')
+        parse_pool = get_rss_parse_pool()
+        feed_data = None
+        with download_deadline(response, deadline):
+            if parse_pool is not None:
+                content = b''.join(iter_feed_chunks(response, max_bytes, deadline))
+            else:
+                received = []
+                def recorded_chunks(chunks):
+                    for chunk in chunks:
+                        received.append(chunk)
+                        yield chunk
+
+                chunks = recorded_chunks(iter_feed_chunks(response, max_bytes, deadline))
+                try:
+                    feed_data = parse_feed_incremental(chunks, response.url, fetched_at, limit)
+                except ET.ParseError:
+                    for _ in chunks:
+                        pass
+                    content = b''.join(received)
+
+    if feed_data is None and parse_pool is not None:
+        try:
+            feed_data = parse_pool.submit(parse_feed_document, content, content_type,
+                                          response.url, fetched_at, limit).result()
+        except BrokenProcessPool:
+            discard_rss_parse_pool(parse_pool)
+            raise
+    elif feed_data is None:
+        feed_data = parse_feed_fallback(content, content_type, response.url, fetched_at, limit)
+
+    with feed_validators_lock:
+        feed_validators[feed_url] = response_validators
+    feed_data['http_max_age'] = http_max_age
+    return feed_data
+
+def parse_opml(content):
+    """Returns (name, url) for every feed outline in an OPML document, in document order.
+
+    Outlines nested in folders are included; outlines without an http(s)
+    xmlUrl are ignored. Raises ET.ParseError or ValueError for documents that
+    are not OPML.
+    """
+    root = ET.fromstring(content)
+    if local_name(root.tag) != 'opml':
+        raise ValueError('Not an OPML document')
+
+    feeds = []
+    for outline in root.iter('outline'):
+        url = (outline.get('xmlUrl') or '').strip()
+        if urlparse(url).scheme not in ('http', 'https'):
+            continue
+        name = (outline.get('title') or outline.get('text') or '').strip() or url
+        feeds.append((name, url))
+    return feeds
+
+def build_opml(feeds, title, html_urls=None):
+    """Serializes configured feeds as an OPML 2.0 document."""
+    html_urls = html_urls or {}
+    opml = ET.Element('opml', version='2.0')
+    head = ET.SubElement(opml, 'head')
+    ET.SubElement(head, 'title').text = title
+    ET.SubElement(head, 'dateCreated').text = formatdate(usegmt=True)
+    body = ET.SubElement(opml, 'body')
+    for feed in feeds:
+        outline = ET.SubElement(body, 'outline', type='rss', text=feed['name'],
+                                title=feed['name'], xmlUrl=feed['url'])
+        if html_urls.get(feed['url']):
+            outline.set('htmlUrl', html_urls[feed['url']])
+    return ET.tostring(opml, encoding='utf-8', xml_declaration=True)
+
+# --- Config Store ---
+# config.json is a snapshot of the configuration together with the version it
+# includes. Each change is appended to config.json.journal as one fsync'd line,
+# {"version": N, "ops": [...]}, so a write costs about the size of the change.
+# Readers replay the journal on top of the snapshot, and once the journal holds
+# CONFIG_COMPACT_RECORDS changes it is folded into a new snapshot, which is
+# written to a temporary file and renamed into place.
+#
+# Writers in every worker process take an flock on config.json.lock, re-read
+# any records other workers appended, and apply their change to that latest
+# version. A change made from a form can carry the version it was based on;
+# if the config has moved on since, it is rejected with ConfigConflict (409)
+# instead of overwriting the other change.
+
+class ConfigError(Exception):
+    """A config change that cannot be applied.
+
+    `status` is the HTTP status to report and `op_index` the position of the
+    failing operation in its list, when known.
+    """
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+        self.op_index = None
+
+class ConfigConflict(ConfigError):
+    """A change based on a config version that is no longer the latest."""
+
+    def __init__(self, expected_version, version):
+        super().__init__(f'The configuration was changed elsewhere (now version {version}, '
+                         f'this change was based on {expected_version}). Reload and try again.', 409)
+
+def default_config():
+    """Returns the configuration used when no config file exists yet."""
+    return {
+        "admin": {"username": "admin", "password": "admin"},
+        "groups": [],
+        "api_keys": {
+            "openai_api_key": "",
+            "gemini_api_key": ""
+        },
+        "dashboard_title": "My Dashboard",
+        "rss_feeds": []
+    }
+
+# Process-wide config snapshot, shared by all requests until the files change.
+config_cache = {
+    'snapshot_key': None,
+    'journal_ino': None,
+    'journal_offset': 0,
+    'journal_records': 0,
+    'version': 0,
+    'data_version': None,
+    'data': None
+}
+config_cache_lock = threading.RLock()
+config_write_lock = threading.RLock()
+config_lock_state = {'depth': 0, 'file': None}
+
+@contextlib.contextmanager
+def config_write_locked():
+    """Serializes config writes across threads and, through config.json.lock, across processes.
+
+    Reentrant within a thread, so a commit can compact while holding it.
+    """
+    with config_write_lock:
+        if config_lock_state['depth'] == 0 and fcntl is not None:
+            lock_file = open(app.config['CONFIG_FILE'] + '.lock', 'a')
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            config_lock_state['file'] = lock_file
+        config_lock_state['depth'] += 1
+        try:
+            yield
+        finally:
+            config_lock_state['depth'] -= 1
+            if config_lock_state['depth'] == 0 and config_lock_state['file'] is not None:
+                # Closing the file releases the flock
+                config_lock_state['file'].close()
+                config_lock_state['file'] = None
+
+def check_config_version(data, expected_version):
+    """Raises ConfigConflict unless `expected_version` is None or the version of `data`."""
+    if expected_version is not None and data.version != expected_version:
+        raise ConfigConflict(expected_version, data.version)
+
+def config_journal_path():
+    """Returns the path of the journal that sits next to the config file."""
+    return app.config['CONFIG_FILE'] + '.journal'
+
+def config_file_key(path):
+    """Identifies a version of a file by inode, size and mtime, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+def write_config_snapshot(data, version):
+    """Atomically replaces config.json with `data` at `version`."""
+    path = app.config['CONFIG_FILE']
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(dict(version=version, **data), f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+def replay_config_journal(data, version, offset):
+    """Applies journal records newer than `version`, starting at byte `offset`.
+
+    Returns (data, version, offset, records) where offset is the end of the
+    last complete record read. A torn final line left by a crash is ignored.
+    """
+    records = 0
+    try:
+        with open(config_journal_path(), 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"Error reading config journal at byte {offset}; ignoring the rest")
+                    break
+                offset += len(line)
+                records += 1
+                if record['version'] <= version:
+                    continue
+                try:
+                    data = apply_config_ops(data, record['ops'])
+                except ConfigError as e:
+                    print(f"Error replaying config change {record['version']}: {str(e)}")
+                version = record['version']
+    except FileNotFoundError:
+        pass
+    return data, version, offset, records
+
+def load_config_snapshot():
+    """Returns the cached config, re-reading only what changed in the configured backend."""
+    if app.config['CONFIG_BACKEND'] == 'sqlite':
+        return load_config_sqlite()
+    return load_config_journal()
+
+def load_config_journal():
+    """Returns the cached config, re-reading only what changed in config.json and its journal."""
+    path = app.config['CONFIG_FILE']
+    journal_key = config_file_key(config_journal_path())
+    journal_ino, journal_size = (journal_key[0], journal_key[1]) if journal_key else (None, 0)
+    with config_cache_lock:
+        snapshot_key = config_file_key(path)
+        cached = config_cache['data'] is not None and config_cache['snapshot_key'] == snapshot_key
+        if cached and config_cache['journal_ino'] == journal_ino and journal_size == config_cache['journal_offset']:
+            return config_cache['data']
+
+        if cached and config_cache['journal_ino'] == journal_ino and journal_size > config_cache['journal_offset']:
+            # Another process appended to the journal; apply just the new records
+            data, version, offset, records = replay_config_journal(
+                config_cache['data'], config_cache['version'], config_cache['journal_offset'])
+            records += config_cache['journal_records']
+        else:
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                version = data.pop('version', 0)
+            except (FileNotFoundError, json.JSONDecodeError):
+                data, version = default_config(), 0
+                write_config_snapshot(data, version)
+                snapshot_key = config_file_key(path)
+            data, version, offset, records = replay_config_journal(as_config(data), version, 0)
+
+        data.version = version
+        config_cache.update(snapshot_key=snapshot_key, journal_ino=journal_ino, journal_offset=offset,
+                            journal_records=records, version=version, data=data)
+        return data
+
 def get_config():
-    """Reads the configuration data from the JSON file."""
+    """Gets the configuration data.
+
+    The returned dict is shared with other requests and must be treated as
+    read-only; changes go through commit_config_ops().
+    """
     if 'config' not in g:
-        try:
-            with open(app.config['CONFIG_FILE'], 'r') as f:
-                g.config = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            g.config = {
-                "admin": {"username": "admin", "password": "admin"},
-                "groups": [],
-                "api_keys": {
-                    "openai_api_key": "",
-                    "gemini_api_key": ""
-                },
-                "dashboard_title": "My Dashboard",
-                "rss_feeds": []
-            }
-            save_config(g.config)
+        g.config = load_config_snapshot()
     return g.config
 
-def save_config(data):
-    """Saves the configuration data to the JSON file."""
-    with open(app.config['CONFIG_FILE'], 'w') as f:
-        json.dump(data, f, indent=4)
+def form_expected_version():
+    """Returns the config version a submitted form was based on, or None if it did not send one."""
+    version = request.form.get('config_version', '')
+    return int(version) if version.isdigit() else None
+
+def commit_config_ops(ops, expected_version=None):
+    """Applies a list of config operations and persists them as one change.
+
+    The operations are validated against the latest config, including changes
+    other workers made since this request read it, and applied all or
+    nothing; ConfigError is raised if any of them fails. With
+    `expected_version`, ConfigConflict is raised instead if the latest config
+    is not that version. Returns the new configuration.
+    """
+    ops = [with_new_id(op) for op in ops]
+    if app.config['CONFIG_BACKEND'] == 'sqlite':
+        new_data = commit_config_sqlite(ops, expected_version)
+    else:
+        new_data = commit_config_journal(ops, expected_version)
+    if has_app_context():
+        g.config = new_data
+    return new_data
+
+def with_new_id(op):
+    """Gives an add operation a fresh id, so replaying it recreates the same id."""
+    if not isinstance(op, dict):
+        return op
+    if op.get('op') == 'add_group' and not op.get('id'):
+        return dict(op, id=new_config_id())
+    if op.get('op') == 'add_link' and isinstance(op.get('link'), dict) and not op['link'].get('id'):
+        return dict(op, link=dict(op['link'], id=new_config_id()))
+    return op
+
+def commit_config_journal(ops, expected_version=None):
+    """Applies config operations and appends them to the journal as one record."""
+    with config_write_locked():
+        data = load_config_journal()
+        with config_cache_lock:
+            version, offset = config_cache['version'], config_cache['journal_offset']
+        check_config_version(data, expected_version)
+        new_data = apply_config_ops(data, ops)
+        new_data.version = version + 1
+
+        record = json.dumps({'version': version + 1, 'ops': ops}, separators=(',', ':')) + '\n'
+        with open(config_journal_path(), 'ab') as f:
+            if f.tell() > offset:
+                # Drop a torn record left behind by a crash mid-append
+                f.truncate(offset)
+            f.write(record.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+            journal_ino = os.fstat(f.fileno()).st_ino
+
+        with config_cache_lock:
+            config_cache.update(journal_ino=journal_ino, journal_offset=offset + len(record.encode('utf-8')),
+                                journal_records=config_cache['journal_records'] + 1,
+                                version=version + 1, data=new_data)
+            needs_compaction = config_cache['journal_records'] >= app.config['CONFIG_COMPACT_RECORDS']
+        if needs_compaction:
+            compact_config()
+    return new_data
+
+def install_config_snapshot(data, version):
+    """Writes `data` as the snapshot at `version` and empties the journal."""
+    with config_write_locked():
+        data.version = version
+        write_config_snapshot(data, version)
+        # A crash before the truncate is harmless: replay skips records up to `version`
+        with open(config_journal_path(), 'w') as f:
+            journal_ino = os.fstat(f.fileno()).st_ino
+        with config_cache_lock:
+            config_cache.update(snapshot_key=config_file_key(app.config['CONFIG_FILE']),
+                                journal_ino=journal_ino, journal_offset=0, journal_records=0,
+                                version=version, data=data)
+
+def compact_config():
+    """Folds the journal into a fresh config.json snapshot."""
+    with config_write_locked():
+        data = load_config_journal()
+        install_config_snapshot(data, config_cache['version'])
+
+# Config operations. Each takes the current config and an operation dict and
+# returns a new config, copying only the containers along the changed path so
+# the shared snapshot is never modified. Groups and links are addressed by
+# their stable id; names are still accepted so older journal records replay.
+
+def config_id(*parts):
+    """Derives a stable id for a group or link that was saved without one."""
+    return hashlib.sha1('\x1f'.join(str(part) for part in parts).encode('utf-8')).hexdigest()[:12]
+
+def new_config_id():
+    """Returns a fresh random id for a new group or link."""
+    return uuid.uuid4().hex[:12]
+
+def with_config_ids(data):
+    """Returns `data` with an id on every group and link.
+
+    Entries saved before ids existed get one derived from their position and
+    name, so every worker reading the same snapshot agrees on it; the ids are
+    persisted the next time the snapshot is written.
+    """
+    groups = data.get('groups', [])
+    if all(group.get('id') and all(link.get('id') for link in group['links']) for group in groups):
+        return data
+    new_groups = []
+    for position, group in enumerate(groups):
+        group_id = group.get('id') or config_id('group', position, group['name'])
+        links = [link if link.get('id') else dict(link, id=config_id('link', group_id, link_position, link['name']))
+                 for link_position, link in enumerate(group['links'])]
+        new_groups.append(dict(group, id=group_id, links=links))
+    return dict(data, groups=new_groups)
+
+class ConfigIndex:
+    """Lookup tables for one config snapshot.
+
+    Maps group ids to list positions, case-folded group names to ids, and
+    link ids to (group id, position). Operations copy the tables and patch
+    them instead of rebuilding them; a snapshot's tables are never modified.
+    """
+
+    __slots__ = ('group_positions', 'group_names', 'link_positions')
+
+    def __init__(self, group_positions, group_names, link_positions):
+        self.group_positions = group_positions
+        self.group_names = group_names
+        self.link_positions = link_positions
+
+    @classmethod
+    def build(cls, data):
+        """Indexes every group and link in a config."""
+        group_positions, group_names, link_positions = {}, {}, {}
+        for position, group in enumerate(data.get('groups', [])):
+            group_positions[group['id']] = position
+            group_names.setdefault(group['name'].casefold(), group['id'])
+            for link_position, link in enumerate(group['links']):
+                link_positions[link['id']] = (group['id'], link_position)
+        return cls(group_positions, group_names, link_positions)
+
+    def copy(self):
+        """Returns tables that can be patched without affecting this index."""
+        return ConfigIndex(dict(self.group_positions), dict(self.group_names), dict(self.link_positions))
+
+class Config(dict):
+    """A config snapshot that carries its version and its lookup indexes, built on first use."""
+
+    version = 0
+
+    def __init__(self, data, index=None):
+        super().__init__(data)
+        self._index = index
+
+    @property
+    def index(self):
+        """The snapshot's ConfigIndex."""
+        if self._index is None:
+            self._index = ConfigIndex.build(self)
+        return self._index
+
+def as_config(data):
+    """Wraps a plain config dict, adding any missing ids."""
+    return data if isinstance(data, Config) else Config(with_config_ids(data))
+
+def find_group_index(data, ref):
+    """Returns the position of a group given its id or name, raising ConfigError if it does not exist."""
+    index = data.index
+    group_id = ref if ref in index.group_positions else index.group_names.get(str(ref or '').casefold())
+    if group_id is None:
+        raise ConfigError('Group not found.', 404)
+    return index.group_positions[group_id]
+
+def find_link_index(data, group_index, ref):
+    """Returns the position of a link in a group given its id or name, raising ConfigError if it does not exist."""
+    group = data['groups'][group_index]
+    location = data.index.link_positions.get(ref)
+    if location is not None and location[0] == group['id']:
+        return location[1]
+    link_index = next((i for i, link in enumerate(group['links']) if link['name'] == ref), None)
+    if link_index is None:
+        raise ConfigError(f'Link not found in group "{group["name"]}".', 404)
+    return link_index
+
+def find_group(data, ref):
+    """Returns a group given its id or name."""
+    return data['groups'][find_group_index(data, ref)]
+
+def find_link(data, group_ref, ref):
+    """Returns a group and one of its links given their ids or names."""
+    group_index = find_group_index(data, group_ref)
+    return data['groups'][group_index], data['groups'][group_index]['links'][find_link_index(data, group_index, ref)]
+
+def check_group_name(data, name, current_id=None):
+    """Raises ConfigError if another group already uses `name`, ignoring case."""
+    if not name:
+        raise ConfigError('Group name is required.')
+    existing = data.index.group_names.get(name.casefold())
+    if existing is not None and existing != current_id:
+        raise ConfigError('A group with this name already exists.')
+
+def moved(items, index, direction, kind):
+    """Swaps the item at `index` one step up or down in a copy of `items`.
+
+    Returns the new list and the position the item moved to.
+    """
+    target = index - 1 if direction == 'up' else index + 1 if direction == 'down' else -1
+    if not 0 <= target < len(items):
+        raise ConfigError(f'Cannot move {kind} in that direction.')
+    items = list(items)
+    items[index], items[target] = items[target], items[index]
+    return items, target
+
+def replace_group(data, position, group, index=None):
+    """Returns a copy of the config with the group at `position` replaced."""
+    groups = list(data['groups'])
+    groups[position] = group
+    return Config(dict(data, groups=groups), index or data.index)
+
+def op_add_group(data, op):
+    """Appends a new, empty group."""
+    check_group_name(data, op.get('name'))
+    group_id = op.get('id') or config_id('group', len(data['groups']), op['name'])
+    if group_id in data.index.group_positions:
+        raise ConfigError('A group with this id already exists.')
+    index = data.index.copy()
+    index.group_positions[group_id] = len(data['groups'])
+    index.group_names[op['name'].casefold()] = group_id
+    group = {"id": group_id, "name": op['name'], "icon": op.get('icon'), "links": []}
+    return Config(dict(data, groups=data['groups'] + [group]), index)
+
+def op_edit_group(data, op):
+    """Renames a group and changes its icon."""
+    position = find_group_index(data, op.get('group'))
+    group = data['groups'][position]
+    check_group_name(data, op.get('name'), current_id=group['id'])
+    index = data.index.copy()
+    if index.group_names.get(group['name'].casefold()) == group['id']:
+        del index.group_names[group['name'].casefold()]
+    index.group_names[op['name'].casefold()] = group['id']
+    return replace_group(data, position, dict(group, name=op['name'], icon=op.get('icon')), index)
+
+def op_delete_group(data, op):
+    """Removes a group and its links."""
+    position = find_group_index(data, op.get('group'))
+    group = data['groups'][position]
+    groups = data['groups'][:position] + data['groups'][position + 1:]
+    index = data.index.copy()
+    del index.group_positions[group['id']]
+    if index.group_names.get(group['name'].casefold()) == group['id']:
+        del index.group_names[group['name'].casefold()]
+    for later_position in range(position, len(groups)):
+        index.group_positions[groups[later_position]['id']] = later_position
+    for link in group['links']:
+        index.link_positions.pop(link['id'], None)
+    return Config(dict(data, groups=groups), index)
+
+def op_move_group(data, op):
+    """Moves a group one place up or down."""
+    position = find_group_index(data, op.get('group'))
+    groups, target = moved(data['groups'], position, op.get('direction'), 'group')
+    index = data.index.copy()
+    index.group_positions[groups[position]['id']] = position
+    index.group_positions[groups[target]['id']] = target
+    return Config(dict(data, groups=groups), index)
+
+def op_add_link(data, op):
+    """Appends a link to a group."""
+    position = find_group_index(data, op.get('group'))
+    link = op.get('link') or {}
+    if not link.get('name') or not link.get('url'):
+        raise ConfigError('Link Name and URL are required fields.')
+    group = data['groups'][position]
+    link_id = link.get('id') or config_id('link', group['id'], len(group['links']), link['name'])
+    if link_id in data.index.link_positions:
+        raise ConfigError('A link with this id already exists.')
+    new_link = {
+        "id": link_id,
+        "name": link['name'],
+        "url": link['url'],
+        "description": link.get('description'),
+        "icon": link.get('icon')
+    }
+    index = data.index.copy()
+    index.link_positions[link_id] = (group['id'], len(group['links']))
+    return replace_group(data, position, dict(group, links=group['links'] + [new_link]), index)
+
+def op_edit_link(data, op):
+    """Updates some of a link's fields."""
+    position = find_group_index(data, op.get('group'))
+    group = data['groups'][position]
+    link_index = find_link_index(data, position, op.get('link'))
+    changes = {key: value for key, value in (op.get('changes') or {}).items()
+               if key in ('name', 'url', 'description', 'icon')}
+    if ('name' in changes and not changes['name']) or ('url' in changes and not changes['url']):
+        raise ConfigError('Link Name and URL are required fields.')
+    links = list(group['links'])
+    links[link_index] = dict(links[link_index], **changes)
+    return replace_group(data, position, dict(group, links=links))
+
+def op_delete_link(data, op):
+    """Removes a link from a group; a name removes every link with that name."""
+    position = find_group_index(data, op.get('group'))
+    group = data['groups'][position]
+    location = data.index.link_positions.get(op.get('link'))
+    if location is not None and location[0] == group['id']:
+        links = group['links'][:location[1]] + group['links'][location[1] + 1:]
+    else:
+        links = [link for link in group['links'] if link['name'] != op.get('link')]
+    if len(links) == len(group['links']):
+        raise ConfigError(f'Link not found in group "{group["name"]}".', 404)
+    index = data.index.copy()
+    for link in group['links']:
+        index.link_positions.pop(link['id'], None)
+    for link_position, link in enumerate(links):
+        index.link_positions[link['id']] = (group['id'], link_position)
+    return replace_group(data, position, dict(group, links=links), index)
+
+def op_move_link(data, op):
+    """Moves a link one place up or down within its group."""
+    position = find_group_index(data, op.get('group'))
+    group = data['groups'][position]
+    link_index = find_link_index(data, position, op.get('link'))
+    links, target = moved(group['links'], link_index, op.get('direction'), 'link')
+    index = data.index.copy()
+    index.link_positions[links[link_index]['id']] = (group['id'], link_index)
+    index.link_positions[links[target]['id']] = (group['id'], target)
+    return replace_group(data, position, dict(group, links=links), index)
+
+def check_permutation(order, positions, kind):
+    """Raises ConfigError unless `order` lists every id in `positions` exactly once."""
+    if not isinstance(order, list) or len(order) != len(positions):
+        raise ConfigError(f'The new order must list every {kind} exactly once.')
+    seen = set()
+    for item_id in order:
+        if not isinstance(item_id, str) or item_id not in positions or item_id in seen:
+            raise ConfigError(f'The new order must list every {kind} exactly once.')
+        seen.add(item_id)
+
+def op_reorder_groups(data, op):
+    """Puts the groups in the order of the ids in `order`."""
+    order = op.get('order')
+    check_permutation(order, data.index.group_positions, 'group')
+    groups = [data['groups'][data.index.group_positions[group_id]] for group_id in order]
+    index = data.index.copy()
+    index.group_positions = {group_id: position for position, group_id in enumerate(order)}
+    return Config(dict(data, groups=groups), index)
+
+def op_reorder_links(data, op):
+    """Puts a group's links in the order of the ids in `order`."""
+    position = find_group_index(data, op.get('group'))
+    group = data['groups'][position]
+    order = op.get('order')
+    link_positions = {link['id']: link_index for link_index, link in enumerate(group['links'])}
+    check_permutation(order, link_positions, 'link in the group')
+    index = data.index.copy()
+    for link_index, link_id in enumerate(order):
+        index.link_positions[link_id] = (group['id'], link_index)
+    links = [group['links'][link_positions[link_id]] for link_id in order]
+    return replace_group(data, position, dict(group, links=links), index)
+
+def op_add_feed(data, op):
+    """Appends an RSS feed."""
+    feed = op.get('feed') or {}
+    if not feed.get('name') or not feed.get('url'):
+        raise ConfigError('Feed Name and URL are required fields.')
+    feeds = data.get('rss_feeds', [])
+    if any(existing['name'].lower() == feed['name'].lower() for existing in feeds):
+        raise ConfigError('A feed with this name already exists.')
+    return Config(dict(data, rss_feeds=feeds + [feed]), data.index)
+
+def find_feed_index(data, name):
+    """Returns the position of an RSS feed given its name, raising ConfigError if it does not exist."""
+    for position, feed in enumerate(data.get('rss_feeds', [])):
+        if feed['name'] == name:
+            return position
+    raise ConfigError(f'RSS Feed "{name}" not found.', 404)
+
+def op_edit_feed(data, op):
+    """Updates some of an RSS feed's fields: name, url and per-feed fetch limits."""
+    feeds = list(data.get('rss_feeds', []))
+    position = find_feed_index(data, op.get('feed'))
+    changes = {key: value for key, value in (op.get('changes') or {}).items()
+               if key in ('name', 'url', 'connect_timeout', 'read_timeout', 'max_bytes')}
+    if ('name' in changes and not changes['name']) or ('url' in changes and not changes['url']):
+        raise ConfigError('Feed Name and URL are required fields.')
+    if 'name' in changes and any(other['name'].lower() == changes['name'].lower()
+                                 for other_position, other in enumerate(feeds) if other_position != position):
+        raise ConfigError('A feed with this name already exists.')
+    feeds[position] = dict(feeds[position], **changes)
+    return Config(dict(data, rss_feeds=feeds), data.index)
+
+def op_move_feed(data, op):
+    """Moves an RSS feed one place up or down."""
+    feeds, _ = moved(data.get('rss_feeds', []), find_feed_index(data, op.get('feed')), op.get('direction'), 'feed')
+    return Config(dict(data, rss_feeds=feeds), data.index)
+
+def op_reorder_feeds(data, op):
+    """Puts the RSS feeds in the order of the names in `order`."""
+    order = op.get('order')
+    positions = {feed['name']: position for position, feed in enumerate(data.get('rss_feeds', []))}
+    check_permutation(order, positions, 'feed')
+    return Config(dict(data, rss_feeds=[data['rss_feeds'][positions[name]] for name in order]), data.index)
+
+def op_delete_feed(data, op):
+    """Removes an RSS feed."""
+    feeds = data.get('rss_feeds', [])
+    remaining = [feed for feed in feeds if feed['name'] != op.get('feed')]
+    if len(remaining) == len(feeds):
+        raise ConfigError(f'RSS Feed "{op.get("feed")}" not found.', 404)
+    return Config(dict(data, rss_feeds=remaining), data.index)
+
+def op_set_title(data, op):
+    """Changes the dashboard title."""
+    title = (op.get('title') or '').strip()
+    if not title:
+        raise ConfigError('Dashboard title is required.')
+    if len(title) > 50:
+        raise ConfigError('Dashboard title must be 50 characters or less.')
+    return Config(dict(data, dashboard_title=title), data.index)
+
+def op_set_api_keys(data, op):
+    """Updates the API keys that were given."""
+    api_keys = dict(data.get('api_keys') or {'openai_api_key': '', 'gemini_api_key': ''})
+    for key in ('openai_api_key', 'gemini_api_key'):
+        if op.get(key):
+            api_keys[key] = op[key]
+    return Config(dict(data, api_keys=api_keys), data.index)
+
+def op_set_admin_password(data, op):
+    """Changes the admin password."""
+    password = op.get('password') or ''
+    if len(password) < 4:
+        raise ConfigError('New password must be at least 4 characters long.')
+    return Config(dict(data, admin=dict(data.get('admin', {}), password=password)), data.index)
+
+CONFIG_OPS = {
+    'add_group': op_add_group,
+    'edit_group': op_edit_group,
+    'delete_group': op_delete_group,
+    'move_group': op_move_group,
+    'add_link': op_add_link,
+    'edit_link': op_edit_link,
+    'delete_link': op_delete_link,
+    'move_link': op_move_link,
+    'reorder_groups': op_reorder_groups,
+    'reorder_links': op_reorder_links,
+    'add_feed': op_add_feed,
+    'edit_feed': op_edit_feed,
+    'delete_feed': op_delete_feed,
+    'move_feed': op_move_feed,
+    'reorder_feeds': op_reorder_feeds,
+    'set_title': op_set_title,
+    'set_api_keys': op_set_api_keys,
+    'set_admin_password': op_set_admin_password
+}
+
+def config_op_handler(op):
+    """Returns the function that applies an operation, raising ConfigError for unknown ones."""
+    handler = CONFIG_OPS.get(op.get('op')) if isinstance(op, dict) else None
+    if handler is None:
+        raise ConfigError(f'Unknown config operation: {op.get("op") if isinstance(op, dict) else op!r}.')
+    return handler
+
+def apply_config_op(data, op, op_index):
+    """Applies one operation from a list, recording its position on any ConfigError."""
+    try:
+        return config_op_handler(op)(data, op)
+    except ConfigError as e:
+        e.op_index = op_index
+        raise
+
+def apply_config_ops(data, ops):
+    """Returns the config that results from applying `ops` in order, raising ConfigError on the first failure."""
+    data = as_config(data)
+    for op_index, op in enumerate(ops):
+        data = apply_config_op(data, op, op_index)
+    return data
+
+# SQLite config backend. With CONFIG_BACKEND = 'sqlite' the config lives in CONFIG_DB: one row per
+# group, link and feed, ordered by a position column, and one JSON value per
+# remaining top-level setting. Changes run in a single IMMEDIATE transaction,
+# so concurrent workers are serialized by SQLite, and each operation touches
+# only the rows it changes. PRAGMA data_version tells a worker when another
+# connection has committed and its cached copy is stale. The config version is
+# kept in settings and bumped by every commit.
+CONFIG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY,
+    uid TEXT,
+    name TEXT NOT NULL,
+    icon TEXT,
+    position INTEGER NOT NULL
+);
+DROP INDEX IF EXISTS idx_groups_name;
+CREATE INDEX IF NOT EXISTS idx_groups_position ON groups (position);
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY,
+    group_id INTEGER NOT NULL REFERENCES groups (id),
+    uid TEXT,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    description TEXT,
+    icon TEXT,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_links_group_position ON links (group_id, position);
+DROP INDEX IF EXISTS idx_links_group_name;
+CREATE TABLE IF NOT EXISTS feeds (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    options TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_feeds_name ON feeds (name);
+"""
+
+config_db = None
+
+def get_config_db():
+    """Opens the process's config database, creating it from config.json on first use.
+
+    The connection is shared by all threads; callers hold config_cache_lock.
+    """
+    global config_db
+    if config_db is None:
+        db = sqlite3.connect(app.config['CONFIG_DB'], isolation_level=None, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA busy_timeout=5000')
+        db.executescript(CONFIG_SCHEMA)
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            # Databases created before groups and links had stable ids get a uid column
+            for table in ('groups', 'links'):
+                if 'uid' not in {row['name'] for row in db.execute(f'PRAGMA table_info({table})')}:
+                    db.execute(f'ALTER TABLE {table} ADD COLUMN uid TEXT')
+            if db.execute('SELECT 1 FROM groups WHERE uid IS NULL UNION ALL '
+                          'SELECT 1 FROM links WHERE uid IS NULL LIMIT 1').fetchone():
+                write_config_rows(db, read_config_rows(db))
+            db.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_groups_uid ON groups (uid)')
+            db.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_links_uid ON links (uid)')
+            if db.execute('SELECT COUNT(*) FROM settings').fetchone()[0] == 0:
+                # Migrate the existing JSON config (including its journal) on first start
+                if os.path.exists(app.config['CONFIG_FILE']):
+                    data = load_config_journal()
+                    print(f"Migrating {app.config['CONFIG_FILE']} to {app.config['CONFIG_DB']}")
+                else:
+                    data = default_config()
+                write_config_rows(db, as_config(data))
+            db.execute('COMMIT')
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+        config_db = db
+    return config_db
+
+def write_config_rows(db, data):
+    """Replaces every row in the config database with `data`."""
+    for table in ('settings', 'links', 'groups', 'feeds'):
+        db.execute(f'DELETE FROM {table}')
+    db.executemany('INSERT INTO settings (key, value) VALUES (?, ?)',
+                   [(key, json.dumps(value)) for key, value in data.items()
+                    if key not in ('groups', 'rss_feeds', 'version')] + [('version', json.dumps(data.version))])
+    for position, group in enumerate(data.get('groups', [])):
+        group_id = db.execute('INSERT INTO groups (uid, name, icon, position) VALUES (?, ?, ?, ?)',
+                              (group['id'], group['name'], group.get('icon'), position)).lastrowid
+        db.executemany(
+            'INSERT INTO links (group_id, uid, name, url, description, icon, position) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(group_id, link['id'], link['name'], link['url'], link.get('description'), link.get('icon'),
+              link_position)
+             for link_position, link in enumerate(group.get('links', []))])
+    for position, feed in enumerate(data.get('rss_feeds', [])):
+        insert_feed_row(db, feed, position)
+
+def feed_options(feed):
+    """Returns a feed's per-feed options, everything but its name and url, as JSON."""
+    return json.dumps({key: value for key, value in feed.items() if key not in ('name', 'url')})
+
+def insert_feed_row(db, feed, position):
+    """Inserts a feed, keeping its per-feed options as JSON."""
+    db.execute('INSERT INTO feeds (name, url, options, position) VALUES (?, ?, ?, ?)',
+               (feed['name'], feed['url'], feed_options(feed), position))
+
+def read_config_rows(db):
+    """Builds the config dict from the config database."""
+    data = {row['key']: json.loads(row['value']) for row in db.execute('SELECT key, value FROM settings')}
+    version = data.pop('version', 0)
+    groups, groups_by_id = [], {}
+    for row in db.execute('SELECT id, uid, name, icon FROM groups ORDER BY position'):
+        group = {"id": row['uid'], "name": row['name'], "icon": row['icon'], "links": []}
+        groups.append(group)
+        groups_by_id[row['id']] = group
+    for row in db.execute('SELECT group_id, uid, name, url, description, icon FROM links ORDER BY group_id, position'):
+        groups_by_id[row['group_id']]['links'].append({
+            "id": row['uid'],
+            "name": row['name'],
+            "url": row['url'],
+            "description": row['description'],
+            "icon": row['icon']
+        })
+    data['groups'] = groups
+    data['rss_feeds'] = [dict({"name": row['name'], "url": row['url']}, **json.loads(row['options']))
+                         for row in db.execute('SELECT name, url, options FROM feeds ORDER BY position')]
+    data = as_config(data)
+    data.version = version
+    return data
+
+def current_config_sqlite(db):
+    """Returns the cached config, re-reading the database if another connection changed it.
+
+    Must be called with config_cache_lock held.
+    """
+    data_version = db.execute('PRAGMA data_version').fetchone()[0]
+    if config_cache['data'] is None or config_cache['data_version'] != data_version:
+        in_transaction = db.in_transaction
+        if not in_transaction:
+            db.execute('BEGIN')
+        try:
+            config_cache.update(data=read_config_rows(db), data_version=data_version)
+        finally:
+            if not in_transaction:
+                db.execute('COMMIT')
+    return config_cache['data']
+
+def load_config_sqlite():
+    """Returns the cached config from the config database."""
+    with config_cache_lock:
+        return current_config_sqlite(get_config_db())
+
+def commit_config_sqlite(ops, expected_version=None):
+    """Applies config operations to the config database in one transaction."""
+    with config_write_lock, config_cache_lock:
+        db = get_config_db()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            data = current_config_sqlite(db)
+            check_config_version(data, expected_version)
+            version = data.version + 1
+            for op_index, op in enumerate(ops):
+                new_data = apply_config_op(data, op, op_index)
+                CONFIG_ROW_WRITERS[op['op']](db, data, new_data, op)
+                data = new_data
+            data.version = version
+            db.execute("INSERT INTO settings (key, value) VALUES ('version', ?) "
+                       'ON CONFLICT (key) DO UPDATE SET value = excluded.value', (json.dumps(version),))
+            db.execute('COMMIT')
+        except BaseException:
+            db.execute('ROLLBACK')
+            # Force a re-read in case the cache was refreshed inside the rolled back transaction
+            config_cache['data'] = None
+            raise
+        config_cache['data'] = data
+        return data
+
+# Row writers persist one config operation. Each gets the config before and
+# after the operation, which has already been validated in memory, and finds
+# its rows through the uid and position indexes.
+
+def group_row(db, data, ref):
+    """Returns the id and position of a group given its id or name in `data`."""
+    uid = data['groups'][find_group_index(data, ref)]['id']
+    return db.execute('SELECT id, position FROM groups WHERE uid = ?', (uid,)).fetchone()
+
+def link_row(db, data, group_ref, ref):
+    """Returns the id and position of a link given its group and its id or name in `data`."""
+    position = find_group_index(data, group_ref)
+    uid = data['groups'][position]['links'][find_link_index(data, position, ref)]['id']
+    return db.execute('SELECT id, position FROM links WHERE uid = ?', (uid,)).fetchone()
+
+def swap_with_neighbour(db, table, row, direction, scope='', params=()):
+    """Swaps a row's position with the row just above or below it."""
+    comparison, order = ('<', 'DESC') if direction == 'up' else ('>', 'ASC')
+    neighbour = db.execute(f'SELECT id, position FROM {table} WHERE position {comparison} ? {scope} '
+                           f'ORDER BY position {order} LIMIT 1', (row['position'], *params)).fetchone()
+    db.execute(f'UPDATE {table} SET position = ? WHERE id = ?', (neighbour['position'], row['id']))
+    db.execute(f'UPDATE {table} SET position = ? WHERE id = ?', (row['position'], neighbour['id']))
+
+def write_add_group(db, before, after, op):
+    """Inserts a group after the last one."""
+    group = after['groups'][-1]
+    db.execute('INSERT INTO groups (uid, name, icon, position) '
+               'VALUES (?, ?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM groups))',
+               (group['id'], group['name'], group['icon']))
+
+def write_edit_group(db, before, after, op):
+    """Updates a group's name and icon."""
+    db.execute('UPDATE groups SET name = ?, icon = ? WHERE id = ?',
+               (op['name'], op.get('icon'), group_row(db, before, op['group'])['id']))
+
+def write_delete_group(db, before, after, op):
+    """Deletes a group and its links."""
+    group_id = group_row(db, before, op['group'])['id']
+    db.execute('DELETE FROM links WHERE group_id = ?', (group_id,))
+    db.execute('DELETE FROM groups WHERE id = ?', (group_id,))
+
+def write_move_group(db, before, after, op):
+    """Swaps a group with its neighbour."""
+    swap_with_neighbour(db, 'groups', group_row(db, before, op['group']), op['direction'])
+
+def write_add_link(db, before, after, op):
+    """Inserts a link after the last one in its group."""
+    link = after['groups'][find_group_index(after, op['group'])]['links'][-1]
+    group_id = group_row(db, before, op['group'])['id']
+    db.execute('INSERT INTO links (group_id, uid, name, url, description, icon, position) '
+               'VALUES (?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM links WHERE group_id = ?))',
+               (group_id, link['id'], link['name'], link['url'], link['description'], link['icon'], group_id))
+
+def write_edit_link(db, before, after, op):
+    """Updates the fields of one link."""
+    position = find_group_index(before, op['group'])
+    link = after['groups'][position]['links'][find_link_index(before, position, op['link'])]
+    db.execute('UPDATE links SET name = ?, url = ?, description = ?, icon = ? WHERE uid = ?',
+               (link['name'], link['url'], link.get('description'), link.get('icon'), link['id']))
+
+def write_delete_link(db, before, after, op):
+    """Deletes the links the operation removed from a group."""
+    position = find_group_index(before, op['group'])
+    remaining = {link['id'] for link in after['groups'][position]['links']}
+    db.executemany('DELETE FROM links WHERE uid = ?',
+                   [(link['id'],) for link in before['groups'][position]['links'] if link['id'] not in remaining])
+
+def write_move_link(db, before, after, op):
+    """Swaps a link with its neighbour in the same group."""
+    group_id = group_row(db, before, op['group'])['id']
+    swap_with_neighbour(db, 'links', link_row(db, before, op['group'], op['link']), op['direction'],
+                        'AND group_id = ?', (group_id,))
+
+def write_reorder_groups(db, before, after, op):
+    """Stores the new position of every group."""
+    db.executemany('UPDATE groups SET position = ? WHERE uid = ?',
+                   [(position, group['id']) for position, group in enumerate(after['groups'])])
+
+def write_reorder_links(db, before, after, op):
+    """Stores the new position of every link in one group."""
+    group = after['groups'][find_group_index(after, op['group'])]
+    db.executemany('UPDATE links SET position = ? WHERE uid = ?',
+                   [(position, link['id']) for position, link in enumerate(group['links'])])
+
+def write_add_feed(db, before, after, op):
+    """Inserts a feed after the last one."""
+    position = db.execute('SELECT COALESCE(MAX(position), -1) + 1 FROM feeds').fetchone()[0]
+    insert_feed_row(db, after['rss_feeds'][-1], position)
+
+def write_edit_feed(db, before, after, op):
+    """Updates the fields of one feed."""
+    feed = after['rss_feeds'][find_feed_index(before, op['feed'])]
+    db.execute('UPDATE feeds SET name = ?, url = ?, options = ? WHERE name = ?',
+               (feed['name'], feed['url'], feed_options(feed), op['feed']))
+
+def write_move_feed(db, before, after, op):
+    """Swaps a feed with its neighbour."""
+    row = db.execute('SELECT id, position FROM feeds WHERE name = ?', (op['feed'],)).fetchone()
+    swap_with_neighbour(db, 'feeds', row, op['direction'])
+
+def write_reorder_feeds(db, before, after, op):
+    """Stores the new position of every feed."""
+    db.executemany('UPDATE feeds SET position = ? WHERE name = ?',
+                   [(position, feed['name']) for position, feed in enumerate(after['rss_feeds'])])
+
+def write_delete_feed(db, before, after, op):
+    """Deletes the feeds with the given name."""
+    db.execute('DELETE FROM feeds WHERE name = ?', (op['feed'],))
+
+def setting_writer(key):
+    """Returns a row writer that stores one top-level setting from the new config."""
+    def write_setting(db, before, after, op):
+        db.execute('INSERT INTO settings (key, value) VALUES (?, ?) '
+                   'ON CONFLICT (key) DO UPDATE SET value = excluded.value', (key, json.dumps(after[key])))
+    return write_setting
+
+CONFIG_ROW_WRITERS = {
+    'add_group': write_add_group,
+    'edit_group': write_edit_group,
+    'delete_group': write_delete_group,
+    'move_group': write_move_group,
+    'add_link': write_add_link,
+    'edit_link': write_edit_link,
+    'delete_link': write_delete_link,
+    'move_link': write_move_link,
+    'reorder_groups': write_reorder_groups,
+    'reorder_links': write_reorder_links,
+    'add_feed': write_add_feed,
+    'edit_feed': write_edit_feed,
+    'delete_feed': write_delete_feed,
+    'move_feed': write_move_feed,
+    'reorder_feeds': write_reorder_feeds,
+    'set_title': setting_writer('dashboard_title'),
+    'set_api_keys': setting_writer('api_keys'),
+    'set_admin_password': setting_writer('admin')
+}
+
+# --- Article Store ---
+
+ARTICLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    feed_url TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    published TEXT NOT NULL,
+    published_ts REAL NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (feed_url, guid)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_ts DESC);
+DROP INDEX IF EXISTS idx_articles_feed_published;
+CREATE INDEX IF NOT EXISTS idx_articles_feed_timeline ON articles (feed_url, published_ts DESC, guid DESC);
+CREATE TABLE IF NOT EXISTS feeds (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    description TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feed_schedule (
+    url TEXT PRIMARY KEY,
+    next_poll REAL NOT NULL,
+    claimed_until REAL NOT NULL,
+    failures INTEGER NOT NULL,
+    last_error TEXT,
+    circuit_open INTEGER NOT NULL
+);
+"""
+
+# Every worker process runs its own poller and feed cache, but they share the
+# article store. A worker polls a due feed only after claiming it in
+# feed_schedule with a conditional UPDATE; the others load what it stored.
+# feeds.revision counts content changes, so workers serving the same stored
+# content hand out the same ETags, and feeds.entry_guids keeps the entries of
+# the last parse in feed order.
+
+# One connection per thread; sqlite3 connections must not be shared across threads.
+article_db_local = threading.local()
+article_db_ready = False
+article_db_lock = threading.Lock()
+article_store_pruned_at = 0
+
+def get_article_db():
+    """Returns this thread's connection to the article store, creating the schema if needed."""
+    global article_db_ready
+    db = getattr(article_db_local, 'db', None)
+    if db is None:
+        db = sqlite3.connect(app.config['ARTICLE_DB'], timeout=10)
+        db.row_factory = sqlite3.Row
+        db.execute('PRAGMA journal_mode=WAL')
+        with article_db_lock:
+            if not article_db_ready:
+                db.executescript(ARTICLE_SCHEMA)
+                # Stores created before workers shared feeds lack these columns
+                columns = {row['name'] for row in db.execute('PRAGMA table_info(feeds)')}
+                for column, definition in (('revision', 'INTEGER NOT NULL DEFAULT 0'), ('entry_guids', 'TEXT')):
+                    if column not in columns:
+                        db.execute(f'ALTER TABLE feeds ADD COLUMN {column} {definition}')
+                article_db_ready = True
+        article_db_local.db = db
+    return db
+
+def store_feed(feed_url, feed_data):
+    """Upserts a freshly parsed feed and its entries into the article store.
+
+    Returns the entries that were not stored before, and sets the feed's new
+    revision on `feed_data`.
+    """
+    with feed_validators_lock:
+        validators = feed_validators.get(feed_url, {})
+    guids = [entry['guid'] for entry in feed_data['entries']]
+    db = get_article_db()
+    with db:
+        known = {row['guid'] for row in db.execute(
+            f"SELECT guid FROM articles WHERE feed_url = ? AND guid IN ({', '.join('?' * len(guids))})",
+            [feed_url, *guids])}
+        db.execute(
+            """INSERT INTO feeds (url, title, link, description, etag, last_modified, fetched_at, revision, entry_guids)
+               VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+               ON CONFLICT (url) DO UPDATE SET
+                   title = excluded.title, link = excluded.link, description = excluded.description,
+                   etag = excluded.etag, last_modified = excluded.last_modified,
+                   fetched_at = excluded.fetched_at, revision = feeds.revision + 1,
+                   entry_guids = excluded.entry_guids""",
+            (feed_url, feed_data['title'], feed_data['link'], feed_data['description'],
+             validators.get('etag'), validators.get('last_modified'), feed_data['fetched_at'], json.dumps(guids)))
+        db.executemany(
+            """INSERT INTO articles (feed_url, guid, title, link, summary, published, published_ts, fetched_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (feed_url, guid) DO UPDATE SET
+                   title = excluded.title, link = excluded.link, summary = excluded.summary,
+                   published = excluded.published,
+                   published_ts = CASE WHEN excluded.published = '' THEN articles.published_ts
+                                       ELSE excluded.published_ts END""",
+            [(feed_url, entry['guid'], entry['title'], entry['link'], entry['summary'],
+              entry['published'], entry['timestamp'], feed_data['fetched_at'])
+             for entry in feed_data['entries']])
+        feed_data['revision'] = db.execute('SELECT revision FROM feeds WHERE url = ?', (feed_url,)).fetchone()[0]
+    return [entry for entry in feed_data['entries'] if entry['guid'] not in known]
+
+def touch_stored_feed(feed_url, fetched_at):
+    """Records a successful poll that found the feed unchanged."""
+    db = get_article_db()
+    with db:
+        db.execute('UPDATE feeds SET fetched_at = ? WHERE url = ?', (fetched_at, feed_url))
+
+def prune_article_store(feed_urls):
+    """Deletes stored feeds that are no longer configured and articles past retention.
+
+    The newest RSS_ENTRY_LIMIT articles of every feed are always kept, so feeds
+    that publish rarely do not disappear from the dashboard.
+    """
+    cutoff = time.time() - app.config['ARTICLE_RETENTION_DAYS'] * 86400
+    placeholders = ','.join('?' * len(feed_urls))
+    db = get_article_db()
+    with db:
+        db.execute(f'DELETE FROM feeds WHERE url NOT IN ({placeholders})', feed_urls)
+        db.execute(f'DELETE FROM feed_schedule WHERE url NOT IN ({placeholders})', feed_urls)
+        db.execute(f'DELETE FROM articles WHERE feed_url NOT IN ({placeholders})', feed_urls)
+        db.execute(
+            """DELETE FROM articles WHERE published_ts < ? AND rowid NOT IN (
+                   SELECT rowid FROM (
+                       SELECT rowid, ROW_NUMBER() OVER (PARTITION BY feed_url ORDER BY published_ts DESC) AS rank
+                       FROM articles)
+                   WHERE rank <= ?)""", (cutoff, app.config['RSS_ENTRY_LIMIT']))
+
+def stored_feed_data(db, row):
+    """Builds a feed cache entry from a stored feed row and the articles of its last parse."""
+    if row['entry_guids'] is None:
+        # Stored before the parsed entries were recorded
+        articles = db.execute(
+            """SELECT guid, title, link, summary, published, published_ts FROM articles
+               WHERE feed_url = ? ORDER BY published_ts DESC LIMIT ?""",
+            (row['url'], app.config['RSS_ENTRY_LIMIT'])).fetchall()
+    else:
+        guids = json.loads(row['entry_guids'])
+        stored = {article['guid']: article for article in db.execute(
+            f"""SELECT guid, title, link, summary, published, published_ts FROM articles
+                WHERE feed_url = ? AND guid IN ({', '.join('?' * len(guids))})""", [row['url'], *guids])}
+        articles = [stored[guid] for guid in guids if guid in stored]
+    entries = [{
+        'guid': entry['guid'],
+        'title': entry['title'],
+        'link': entry['link'],
+        'summary': entry['summary'],
+        'published': entry['published'],
+        'timestamp': entry['published_ts']
+    } for entry in articles]
+    return {
+        'title': row['title'],
+        'link': row['link'],
+        'description': row['description'],
+        'entries': entries,
+        'fetched_at': row['fetched_at'],
+        'revision': row['revision']
+    }
 
-def fetch_rss_feed(feed_url):
-    """Fetches RSS feed and returns parsed data."""
+def apply_stored_schedule(state, row):
+    """Copies a feed's shared schedule row into its local polling state."""
+    state['failures'] = row['failures']
+    state['last_error'] = row['last_error']
+    state['circuit_open'] = bool(row['circuit_open'])
+
+def load_stored_feeds():
+    """Rebuilds the feed cache, validators and poll schedule from the article store after a restart."""
+    db = get_article_db()
+    schedule = {row['url']: row for row in db.execute('SELECT * FROM feed_schedule').fetchall()}
+    for row in db.execute('SELECT * FROM feeds').fetchall():
+        data = stored_feed_data(db, row)
+        with feed_states_lock:
+            state = feed_states.setdefault(row['url'], new_feed_state())
+            state['interval'] = learn_poll_interval(data['entries'])
+            state['last_success'] = row['fetched_at']
+            state['next_poll'] = row['fetched_at'] + state['interval']
+            if row['url'] in schedule:
+                apply_stored_schedule(state, schedule[row['url']])
+                state['next_poll'] = schedule[row['url']]['next_poll']
+        with feed_validators_lock:
+            feed_validators.setdefault(row['url'], {
+                'etag': row['etag'],
+                'last_modified': row['last_modified']
+            })
+        with feed_cache_lock:
+            feed_cache.setdefault(row['url'], data)
+
+def sync_stored_feed(feed_url):
+    """Loads a feed that another worker stored since this one last saw it.
+
+    The new content replaces the cached copy and is published to this
+    worker's dashboards. Returns the cached data, or None if the feed was
+    never stored.
+    """
+    db = get_article_db()
+    row = db.execute('SELECT * FROM feeds WHERE url = ?', (feed_url,)).fetchone()
+    cached = get_cached_feed(feed_url)
+    if row is None:
+        return cached
+    if cached is not None and cached.get('revision') == row['revision']:
+        if row['fetched_at'] > cached['fetched_at']:
+            # Polled again elsewhere and found unchanged
+            cached = dict(cached, fetched_at=row['fetched_at'])
+            cache_feed(feed_url, cached)
+        return cached
+
+    data = stored_feed_data(db, row)
+    with feed_validators_lock:
+        feed_validators[feed_url] = {'etag': row['etag'], 'last_modified': row['last_modified']}
+    cache_feed(feed_url, data)
+    with feed_states_lock:
+        state = feed_states.setdefault(feed_url, new_feed_state())
+        state['interval'] = learn_poll_interval(data['entries'])
+        state['last_success'] = row['fetched_at']
+    known = {entry['guid'] for entry in cached['entries']} if cached else None
+    publish_feed_changes(feed_url, data, [entry for entry in data['entries']
+                                          if known is not None and entry['guid'] not in known])
+    bump_feed_cache_generation()
+    return data
+
+def claim_feed_poll(feed_url, now, lease):
+    """Claims the next poll of a feed for this worker if it is due and no other worker holds it.
+
+    The claim lasts `lease` seconds, or until save_feed_schedule() records
+    the outcome. Returns (claimed, schedule row).
+    """
+    db = get_article_db()
+    with db:
+        db.execute('INSERT OR IGNORE INTO feed_schedule (url, next_poll, claimed_until, failures, circuit_open) '
+                   'VALUES (?, 0, 0, 0, 0)', (feed_url,))
+        claimed = db.execute('UPDATE feed_schedule SET claimed_until = ? '
+                             'WHERE url = ? AND next_poll <= ? AND claimed_until <= ?',
+                             (now + lease, feed_url, now, now)).rowcount == 1
+        row = db.execute('SELECT * FROM feed_schedule WHERE url = ?', (feed_url,)).fetchone()
+    return claimed, row
+
+def save_feed_schedule(feed_url, state):
+    """Records the outcome of a poll for all workers and releases the claim on the feed."""
+    db = get_article_db()
+    with db:
+        db.execute(
+            """INSERT INTO feed_schedule (url, next_poll, claimed_until, failures, last_error, circuit_open)
+               VALUES (?, ?, 0, ?, ?, ?)
+               ON CONFLICT (url) DO UPDATE SET
+                   next_poll = excluded.next_poll, claimed_until = 0, failures = excluded.failures,
+                   last_error = excluded.last_error, circuit_open = excluded.circuit_open""",
+            (feed_url, state['next_poll'], state['failures'], state['last_error'], int(state['circuit_open'])))
+
+def encode_article_cursor(article):
+    """Builds an opaque keyset cursor pointing just past an article in the timeline."""
+    key = [article['published_ts'], article['feed_url'], article['guid']]
+    return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii')
+
+def decode_article_cursor(cursor):
+    """Decodes a cursor from encode_article_cursor(); raises ValueError if it is malformed."""
     try:
-        feed = feedparser.parse(feed_url)
-        if feed.bozo:
-            print(f"Warning: RSS feed {feed_url} has malformed XML")
-        
-        feed_data = {
-            'title': getattr(feed.feed, 'title', 'Unknown Feed'),
-            'link': getattr(feed.feed, 'link', feed_url),
-            'description': getattr(feed.feed, 'description', ''),
-            'entries': []
-        }
-        
-        # Get the latest 3 entries
-        for entry in feed.entries[:5]:
-            entry_data = {
-                'title': getattr(entry, 'title', 'Untitled'),
-                'link': getattr(entry, 'link', ''),
-                'summary': getattr(entry, 'summary', getattr(entry, 'description', ''))[:150] + '...' if getattr(entry, 'summary', getattr(entry, 'description', '')) else '',
-                'published': getattr(entry, 'published', '')
-            }
-            feed_data['entries'].append(entry_data)
-        
-        return feed_data
+        published_ts, feed_url, guid = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return float(published_ts), str(feed_url), str(guid)
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Invalid cursor')
+
+def iter_feed_timeline(feed_url, after, limit):
+    """Yields up to `limit` stored articles of one feed, newest first, strictly after a cursor key.
+
+    Timeline order is (published_ts, feed_url, guid) descending, so the keyset
+    condition for a single feed depends on how its URL compares to the cursor's.
+    """
+    db = get_article_db()
+    query = 'SELECT feed_url, guid, title, link, summary, published, published_ts FROM articles WHERE feed_url = ?'
+    params = [feed_url]
+    if after is not None:
+        after_ts, after_url, after_guid = after
+        if feed_url < after_url:
+            query += ' AND published_ts <= ?'
+            params.append(after_ts)
+        elif feed_url > after_url:
+            query += ' AND published_ts < ?'
+            params.append(after_ts)
+        else:
+            query += ' AND (published_ts < ? OR (published_ts = ? AND guid < ?))'
+            params.extend([after_ts, after_ts, after_guid])
+    query += ' ORDER BY published_ts DESC, guid DESC LIMIT ?'
+    params.append(limit)
+    yield from db.execute(query, params)
+
+def get_article_timeline(feed_urls, cursor=None, limit=20):
+    """Returns (articles, next_cursor) for a time-ordered page of articles across feeds.
+
+    Each feed contributes an index-ordered run of at most `limit` rows; the runs
+    are combined with a k-way heap merge, so a page costs the same no matter how
+    deep into the timeline the cursor points.
+    """
+    after = decode_article_cursor(cursor) if cursor else None
+    runs = [iter_feed_timeline(url, after, limit) for url in feed_urls]
+    merged = heapq.merge(*runs, key=lambda row: (row['published_ts'], row['feed_url'], row['guid']), reverse=True)
+    page = [dict(row) for _, row in zip(range(limit), merged)]
+    next_cursor = encode_article_cursor(page[-1]) if len(page) == limit else None
+    return page, next_cursor
+
+def get_latest_stored_article(feed_url):
+    """Returns the most recently published stored article of a feed, or None."""
+    return get_article_db().execute(
+        """SELECT title, link, summary, published, published_ts FROM articles
+           WHERE feed_url = ? ORDER BY published_ts DESC LIMIT 1""", (feed_url,)).fetchone()
+
+# --- RSS Event Stream ---
+rss_subscribers = set()
+rss_subscribers_lock = threading.Lock()
+rss_event_log = collections.deque(maxlen=app.config['RSS_EVENT_BACKLOG'])
+rss_event_seq = 0
+
+def publish_rss_event(event, data):
+    """Queues an event for every connected dashboard.
+
+    The payload is serialized once and shared by all subscribers. A subscriber
+    whose queue is full has stopped reading and is dropped; its browser
+    reconnects and replays what it missed from the backlog.
+    """
+    global rss_event_seq
+    with rss_subscribers_lock:
+        rss_event_seq += 1
+        message = (rss_event_seq, event, json.dumps(data))
+        rss_event_log.append(message)
+        for subscriber in list(rss_subscribers):
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                rss_subscribers.discard(subscriber)
+
+def current_rss_event_id():
+    """Returns the id of the most recently published event."""
+    with rss_subscribers_lock:
+        return rss_event_seq
+
+def subscribe_rss_events(last_event_id=None):
+    """Registers a new subscriber queue, replaying events after last_event_id.
+
+    If the requested events are no longer in the backlog (or came from a
+    previous run of the server) a single 'resync' event is queued instead so
+    the dashboard reloads everything. Returns None if the process already
+    has RSS_EVENT_MAX_SUBSCRIBERS streams open.
+    """
+    subscriber = queue.Queue(maxsize=app.config['RSS_EVENT_BACKLOG'])
+    with rss_subscribers_lock:
+        if len(rss_subscribers) >= app.config['RSS_EVENT_MAX_SUBSCRIBERS']:
+            return None
+        if last_event_id is not None:
+            oldest = rss_event_log[0][0] if rss_event_log else rss_event_seq + 1
+            if last_event_id > rss_event_seq or last_event_id < oldest - 1:
+                subscriber.put_nowait((rss_event_seq, 'resync', '{}'))
+            else:
+                for message in rss_event_log:
+                    if message[0] > last_event_id:
+                        subscriber.put_nowait(message)
+        rss_subscribers.add(subscriber)
+    return subscriber
+
+def unsubscribe_rss_events(subscriber):
+    """Removes a subscriber queue."""
+    with rss_subscribers_lock:
+        rss_subscribers.discard(subscriber)
+
+def stream_rss_events(subscriber):
+    """Yields queued events in text/event-stream format until the client goes away."""
+    try:
+        yield 'retry: 5000\n\n'
+        while True:
+            try:
+                seq, event, data = subscriber.get(timeout=app.config['RSS_EVENT_HEARTBEAT'])
+            except queue.Empty:
+                with rss_subscribers_lock:
+                    if subscriber not in rss_subscribers:
+                        return
+                # Writing the comment also detects clients that have disconnected
+                yield ': keep-alive\n\n'
+                continue
+            yield f'id: {seq}\nevent: {event}\ndata: {data}\n\n'
+    finally:
+        unsubscribe_rss_events(subscriber)
+
+def public_feed_data(feed_url, feed_data):
+    """Returns the fields of a parsed feed that the dashboard displays."""
+    return {
+        'url': feed_url,
+        'title': feed_data['title'],
+        'link': feed_data['link'],
+        'description': feed_data['description'],
+        'entries': [{
+            'title': entry['title'],
+            'link': entry['link'],
+            'summary': entry['summary'],
+            'published': entry['published']
+        } for entry in feed_data['entries']]
+    }
+
+def publish_feed_changes(feed_url, feed_data, new_entries):
+    """Publishes a 'feed_updated' event and one 'new_article' event per new entry."""
+    publish_rss_event('feed_updated', public_feed_data(feed_url, feed_data))
+    # Oldest first, so the newest article ends up on top of each dashboard
+    for entry in sorted(new_entries, key=lambda e: e['timestamp']):
+        publish_rss_event('new_article', {
+            'title': entry['title'],
+            'link': entry['link'],
+            'summary': entry['summary'],
+            'published': entry['published'],
+            'feed_url': feed_url,
+            'feed_link': feed_data['link']
+        })
+
+# --- RSS Feed Cache ---
+
+# Parsed feeds keyed by feed URL. Populated by the background poller so that
+# request handlers never have to wait on an upstream server.
+feed_cache = {}
+feed_cache_lock = threading.Lock()
+rss_refresh_event = threading.Event()
+rss_poller_thread = None
+rss_poller_lock = threading.Lock()
+rss_executor = None
+rss_executor_lock = threading.Lock()
+
+# Fetches currently in progress keyed by feed URL, so concurrent callers
+# share one download and parse instead of each hitting the upstream server.
+rss_inflight = {}
+rss_inflight_lock = threading.Lock()
+
+def get_cached_feed(feed_url):
+    """Returns the cached parse result for a feed URL, or None if not fetched yet."""
+    with feed_cache_lock:
+        return feed_cache.get(feed_url)
+
+def cache_feed(feed_url, feed_data):
+    """Stores a parse result in the feed cache."""
+    with feed_cache_lock:
+        feed_cache[feed_url] = feed_data
+
+# Counts changes to the feed cache in this process, keying the rendered
+# dashboard. It is bumped after the cache and article store are written, so a
+# page cached under a generation is never older than that generation.
+feed_cache_generation = 0
+# Stands in for the stored revision of feeds this process could not store
+feed_cache_epoch = uuid.uuid4().hex[:8]
+
+def bump_feed_cache_generation():
+    """Marks the feed cache as changed, invalidating ETags handed out for feed responses."""
+    global feed_cache_generation
+    with feed_cache_lock:
+        feed_cache_generation += 1
+
+def feed_cache_tag(config, resource):
+    """Returns the ETag for the feed response `resource` built from `config` and the current feed cache.
+
+    The tag is made from the stored revision of each configured feed, so every
+    worker process serving the same content hands out the same tag.
+    """
+    revisions = []
+    with feed_cache_lock:
+        for feed in config.get('rss_feeds', []):
+            data = feed_cache.get(feed['url'])
+            if data is None:
+                revisions.append(None)
+            elif data.get('revision') is None:
+                revisions.append(f"{feed_cache_epoch}.{data['fetched_at']}")
+            else:
+                revisions.append(data['revision'])
+    digest = hashlib.sha1(json.dumps(revisions).encode('utf-8')).hexdigest()[:16]
+    return f'{resource}.{config.version}.{digest}'
+
+# Polling state per feed URL: when to poll next, at what interval, and how
+# the feed has been failing. Only the refresh pipeline updates it.
+feed_states = {}
+feed_states_lock = threading.Lock()
+
+def new_feed_state():
+    """Returns the polling state of a feed that has never been polled."""
+    return {
+        'next_poll': 0,
+        'interval': app.config['RSS_REFRESH_INTERVAL'],
+        'failures': 0,
+        'last_success': None,
+        'last_error': None,
+        'circuit_open': False
+    }
+
+def get_feed_state(feed_url):
+    """Returns a copy of a feed's polling state."""
+    with feed_states_lock:
+        return dict(feed_states.get(feed_url) or new_feed_state())
+
+def is_circuit_open(feed_url):
+    """Checks whether a failing feed is currently cut off from polling."""
+    with feed_states_lock:
+        state = feed_states.get(feed_url)
+        return bool(state and state['circuit_open'] and time.time() < state['next_poll'])
+
+def learn_poll_interval(entries):
+    """Derives a polling interval from the spacing of a feed's publication times.
+
+    Feeds are polled at twice their median publishing rate, clamped between
+    RSS_MIN_POLL_INTERVAL and RSS_MAX_POLL_INTERVAL.
+    """
+    times = sorted({entry['timestamp'] for entry in entries}, reverse=True)
+    gaps = [newer - older for newer, older in zip(times, times[1:])]
+    if not gaps:
+        return app.config['RSS_REFRESH_INTERVAL']
+    return min(max(statistics.median(gaps) / 2, app.config['RSS_MIN_POLL_INTERVAL']),
+               app.config['RSS_MAX_POLL_INTERVAL'])
+
+def next_allowed_poll(timestamp, skip_hours, skip_days):
+    """Moves a poll time past any UTC hours and weekdays the publisher asked readers to skip."""
+    for _ in range(24 * 7):
+        moment = datetime.fromtimestamp(timestamp, timezone.utc)
+        if moment.hour not in skip_hours and WEEKDAYS[moment.weekday()] not in skip_days:
+            break
+        timestamp += 3600 - moment.minute * 60 - moment.second
+    return timestamp
+
+def feed_fresh_until(feed_data, interval):
+    """Returns the time a fetched feed goes stale.
+
+    The freshness lifetime is the longer of the polling interval and the
+    publisher's hints (RSS <ttl>, Cache-Control max-age or Expires), pushed past
+    <skipHours>/<skipDays>, and never beyond RSS_MAX_STALENESS.
+    """
+    hinted = max(feed_data.get('ttl') or 0, feed_data.get('http_max_age') or 0)
+    fresh_until = next_allowed_poll(feed_data['fetched_at'] + max(interval, hinted),
+                                    feed_data.get('skip_hours', []), feed_data.get('skip_days', []))
+    return min(fresh_until, feed_data['fetched_at'] + app.config['RSS_MAX_STALENESS'])
+
+def record_feed_success(feed_url, feed_data):
+    """Schedules the next poll of a feed after a successful fetch."""
+    now = time.time()
+    with feed_states_lock:
+        state = feed_states.setdefault(feed_url, new_feed_state())
+        if state['circuit_open']:
+            print(f"RSS feed {feed_url} recovered after {state['failures']} failures")
+        state['interval'] = learn_poll_interval(feed_data['entries'])
+        state['next_poll'] = feed_fresh_until(feed_data, state['interval'])
+        state['failures'] = 0
+        state['last_success'] = now
+        state['last_error'] = None
+        state['circuit_open'] = False
+
+def record_feed_failure(feed_url, error):
+    """Backs off exponentially after a failed fetch and opens the circuit after repeated failures."""
+    now = time.time()
+    with feed_states_lock:
+        state = feed_states.setdefault(feed_url, new_feed_state())
+        state['failures'] += 1
+        state['last_error'] = error
+        if state['failures'] == 1:
+            print(f"Error fetching RSS feed {feed_url}: {error}")
+        if state['failures'] >= app.config['RSS_CIRCUIT_THRESHOLD']:
+            if not state['circuit_open']:
+                print(f"RSS feed {feed_url} failed {state['failures']} times in a row; pausing polls")
+            state['circuit_open'] = True
+            state['next_poll'] = now + app.config['RSS_CIRCUIT_COOLDOWN']
+        else:
+            backoff = app.config['RSS_MIN_POLL_INTERVAL'] * 2 ** (state['failures'] - 1)
+            state['next_poll'] = now + min(backoff, app.config['RSS_MAX_BACKOFF'])
+
+def claim_due_feeds(feeds, now):
+    """Returns the due feeds this worker claimed, pushing their schedule out while they run.
+
+    A feed another worker has claimed, or polled since this one last looked,
+    is not returned; its schedule and stored content are loaded instead.
+    """
+    with feed_states_lock:
+        due = [feed for feed in feeds
+               if feed_states.setdefault(feed['url'], new_feed_state())['next_poll'] <= now]
+
+    claimed = []
+    for feed in due:
+        connect_timeout, read_timeout, _ = feed_fetch_limits(feed)
+        try:
+            # The lease outlives the download deadline, and only matters if this worker dies mid-poll
+            is_claimed, row = claim_feed_poll(feed['url'], now, 2 * (connect_timeout + read_timeout))
+        except sqlite3.Error as e:
+            print(f"Error claiming RSS feed {feed['url']}: {str(e)}")
+            is_claimed, row = True, None
+        with feed_states_lock:
+            state = feed_states.setdefault(feed['url'], new_feed_state())
+            if row is not None:
+                apply_stored_schedule(state, row)
+            if not is_claimed and row['claimed_until'] > now:
+                # Look for the claiming worker's results once its refresh job should be done
+                state['next_poll'] = min(row['claimed_until'], now + app.config['RSS_FETCH_DEADLINE'])
+            elif not is_claimed:
+                state['next_poll'] = row['next_poll']
+            elif not state['circuit_open']:
+                # An open circuit keeps its due time, so the trial poll is not skipped as paused
+                state['next_poll'] = now + state['interval']
+        if is_claimed:
+            claimed.append(feed)
+        else:
+            try:
+                sync_stored_feed(feed['url'])
+            except sqlite3.Error as e:
+                print(f"Error loading stored RSS feed {feed['url']}: {str(e)}")
+    return claimed
+
+def seconds_until_next_poll():
+    """Returns how long the poller can sleep before some feed becomes due."""
+    with feed_states_lock:
+        next_poll = min((state['next_poll'] for state in feed_states.values()), default=None)
+    if next_poll is None:
+        return app.config['RSS_REFRESH_INTERVAL']
+    return min(max(next_poll - time.time(), 1), app.config['RSS_REFRESH_INTERVAL'])
+
+def is_fresh(feed_data, max_age):
+    """Checks whether a cached parse result is younger than max_age seconds."""
+    return feed_data is not None and time.time() - feed_data['fetched_at'] < max_age
+
+def fetch_rss_feed_once(feed_url, max_age=None, options=None):
+    """Fetches a feed, coalescing concurrent fetches of the same URL into one.
+
+    A cached result younger than max_age (default RSS_MIN_TTL) is returned
+    without touching the network. Otherwise the first caller performs the
+    fetch and any caller arriving while it is in flight waits for its result.
+    `options` is passed through to fetch_rss_feed().
+    """
+    if max_age is None:
+        max_age = app.config['RSS_MIN_TTL']
+
+    with rss_inflight_lock:
+        cached = get_cached_feed(feed_url)
+        if is_fresh(cached, max_age) or is_circuit_open(feed_url):
+            return cached
+        future = rss_inflight.get(feed_url)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            rss_inflight[feed_url] = future
+
+    if not is_leader:
+        return future.result()
+
+    try:
+        try:
+            data = fetch_rss_feed(feed_url, cached, options)
+        except Exception as e:
+            record_feed_failure(feed_url, str(e))
+            save_poll_outcome(feed_url)
+            data = None
+        else:
+            cache_feed(feed_url, data)
+            record_feed_success(feed_url, data)
+            changed = cached is None or data['entries'] is not cached['entries']
+            try:
+                if changed:
+                    publish_feed_changes(feed_url, data, store_feed(feed_url, data))
+                else:
+                    touch_stored_feed(feed_url, data['fetched_at'])
+            except sqlite3.Error as e:
+                print(f"Error storing RSS feed {feed_url}: {str(e)}")
+            save_poll_outcome(feed_url)
+            if changed:
+                bump_feed_cache_generation()
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with rss_inflight_lock:
+            rss_inflight.pop(feed_url, None)
+
+def save_poll_outcome(feed_url):
+    """Shares a feed's polling state with the other workers, releasing this worker's claim."""
+    try:
+        save_feed_schedule(feed_url, get_feed_state(feed_url))
+    except sqlite3.Error as e:
+        print(f"Error saving poll schedule of RSS feed {feed_url}: {str(e)}")
+
+def refresh_rss_feed(feed):
+    """Fetches a single configured feed and stores the result in the cache."""
+    return fetch_rss_feed_once(feed['url'], options=feed)
+
+def get_rss_executor():
+    """Returns the shared thread pool used for fetching feeds."""
+    global rss_executor
+    with rss_executor_lock:
+        if rss_executor is None:
+            rss_executor = ThreadPoolExecutor(max_workers=app.config['RSS_MAX_WORKERS'],
+                                              thread_name_prefix='rss-fetch')
+        return rss_executor
+
+def fetch_rss_feeds_concurrently(feeds, deadline=None):
+    """Fetches feeds in parallel on the shared pool, waiting at most `deadline` seconds.
+
+    Returns a list of (feed, data, status) tuples in the order of `feeds`, where
+    status is 'ok', 'error' or 'timeout'. Fetches that miss the deadline keep
+    running in the background and still land in the feed cache when they finish.
+    """
+    executor = get_rss_executor()
+    futures = [executor.submit(refresh_rss_feed, feed) for feed in feeds]
+    wait(futures, timeout=deadline)
+
+    results = []
+    for feed, future in zip(feeds, futures):
+        if not future.done():
+            results.append((feed, None, 'timeout'))
+        elif future.exception() is not None or future.result() is None:
+            results.append((feed, None, 'error'))
+        else:
+            results.append((feed, future.result(), 'ok'))
+    return results
+
+def revalidate_in_background(feed):
+    """Queues a refresh of a stale feed unless one is already in flight or it is not due yet.
+
+    A failing feed is not due until its backoff has passed, so dashboard
+    requests cannot retry it faster than the poller would. A feed another
+    worker claimed is loaded from the article store instead.
+    """
+    if time.time() < get_feed_state(feed['url'])['next_poll']:
+        return
+    with rss_inflight_lock:
+        if feed['url'] in rss_inflight:
+            return
+    if claim_due_feeds([feed], time.time()):
+        get_rss_executor().submit(refresh_rss_feed, feed)
+
+def load_rss_feeds(feeds, deadline=None):
+    """Returns (feed, data, status) for each feed, served from the cache whenever possible.
+
+    Stale feeds are returned immediately while a background revalidation runs.
+    Feeds that were never fetched, or whose copy is older than RSS_MAX_STALENESS,
+    are taken from the article store if another worker fetched them, and
+    fetched concurrently otherwise, waiting at most `deadline` seconds; if that
+    fails the old copy is still returned with status 'stale'.
+    """
+    now = time.time()
+    results = []
+    blocking = []
+    for feed in feeds:
+        data = get_cached_feed(feed['url'])
+        if data is None or now - data['fetched_at'] > app.config['RSS_MAX_STALENESS']:
+            try:
+                data = sync_stored_feed(feed['url'])
+            except sqlite3.Error as e:
+                print(f"Error loading stored RSS feed {feed['url']}: {str(e)}")
+        if data is None or now - data['fetched_at'] > app.config['RSS_MAX_STALENESS']:
+            blocking.append(feed)
+        elif now >= feed_fresh_until(data, get_feed_state(feed['url'])['interval']):
+            revalidate_in_background(feed)
+        results.append((feed, data, 'ok'))
+    if not blocking:
+        return results
+
+    fetched = {id(feed): (data, status) for feed, data, status in fetch_rss_feeds_concurrently(blocking, deadline)}
+    merged = []
+    for feed, data, status in results:
+        if id(feed) in fetched:
+            fresh_data, status = fetched[id(feed)]
+            if fresh_data is not None:
+                data = fresh_data
+            elif data is not None:
+                status = 'stale'
+        merged.append((feed, data, status))
+    return merged
+
+rss_validations = {}
+rss_validations_lock = threading.Lock()
+rss_validation_executor = None
+rss_validation_executor_lock = threading.Lock()
+
+def get_rss_validation_executor():
+    """Returns the thread pool that validates feeds for the settings page.
+
+    It is separate from the fetch pool, so validating many feeds at once does
+    not hold up request-path fetches or the poller.
+    """
+    global rss_validation_executor
+    with rss_validation_executor_lock:
+        if rss_validation_executor is None:
+            rss_validation_executor = ThreadPoolExecutor(max_workers=app.config['RSS_IMPORT_CONCURRENCY'],
+                                                         thread_name_prefix='rss-validate')
+        return rss_validation_executor
+
+def validate_rss_feed(feed):
+    """Fetches a feed through the shared pipeline and records the outcome for the settings page."""
+    feed_url = feed['url']
+    with feed_states_lock:
+        state = feed_states.get(feed_url)
+        if state and state['circuit_open']:
+            # An explicit validation gets one attempt even while polls are paused
+            state['circuit_open'] = False
+
+    started = time.monotonic()
+    try:
+        data = fetch_rss_feed_once(feed_url, max_age=0, options=feed)
+        error = None if data else get_feed_state(feed_url)['last_error']
     except Exception as e:
-        print(f"Error fetching RSS feed {feed_url}: {str(e)}")
-        return None
+        data, error = None, str(e)
+    result = {
+        'state': 'failed',
+        'entries': 0,
+        'latency_ms': round((time.monotonic() - started) * 1000),
+        'warning': None,
+        'error': error,
+        'checked_at': time.time()
+    }
+    if data:
+        result['entries'] = len(data['entries'])
+        result['warning'] = data.get('bozo') or (None if data['entries'] else 'Feed has no entries')
+        result['state'] = 'warning' if result['warning'] else 'ok'
+
+    with rss_validations_lock:
+        rss_validations[feed_url] = result
+    return result
+
+def submit_rss_validations(feeds):
+    """Marks feeds as pending validation and validates them on the validation pool.
+
+    Returns the futures of the validations, in the order of `feeds`.
+    """
+    executor = get_rss_validation_executor()
+    futures = []
+    for feed in feeds:
+        with rss_validations_lock:
+            rss_validations[feed['url']] = {'state': 'pending', 'checked_at': None}
+        futures.append(executor.submit(validate_rss_feed, dict(feed)))
+    return futures
+
+def validate_rss_feeds(feeds, deadline):
+    """Validates feeds on the validation pool, waiting at most `deadline` seconds.
+
+    Returns (feed, result) pairs in the order of `feeds`; result is None for
+    feeds that did not finish in time, which stay pending and keep validating
+    in the background.
+    """
+    futures = submit_rss_validations(feeds)
+    wait(futures, timeout=deadline)
+    return [(feed, future.result() if future.done() else None) for feed, future in zip(feeds, futures)]
+
+def get_rss_validation(feed_url):
+    """Returns the latest validation result for a feed, or None if it was never validated."""
+    with rss_validations_lock:
+        result = rss_validations.get(feed_url)
+        return dict(result) if result else None
+
+def refresh_due_rss_feeds():
+    """Refreshes the configured feeds that are due and drops state for removed feeds."""
+    with app.app_context():
+        feeds = list(get_config().get('rss_feeds', []))
+
+    due = claim_due_feeds(feeds, time.time())
+    for feed, data, status in fetch_rss_feeds_concurrently(due, app.config['RSS_FETCH_DEADLINE']):
+        if status == 'timeout':
+            print(f"Warning: RSS feed {feed['url']} did not finish within the refresh deadline")
+
+    # Re-read, since feeds may have been added (and validated) while the fetches ran
+    with app.app_context():
+        configured_urls = {feed['url'] for feed in get_config().get('rss_feeds', [])}
+    with feed_states_lock:
+        for url in list(feed_states):
+            if url not in configured_urls:
+                del feed_states[url]
+    with feed_cache_lock:
+        for url in list(feed_cache):
+            if url not in configured_urls:
+                del feed_cache[url]
+    with feed_validators_lock:
+        for url in list(feed_validators):
+            if url not in configured_urls:
+                del feed_validators[url]
+    with rss_validations_lock:
+        for url in list(rss_validations):
+            # Pending entries may belong to a feed saved after `feeds` was read
+            if url not in configured_urls and rss_validations[url]['state'] != 'pending':
+                del rss_validations[url]
+    global article_store_pruned_at
+    if time.time() - article_store_pruned_at > 3600:
+        prune_article_store(list(configured_urls))
+        article_store_pruned_at = time.time()
+
+def rss_poller():
+    """Background loop that keeps the feed cache warm, polling each feed when it is due."""
+    while True:
+        rss_refresh_event.clear()
+        try:
+            refresh_due_rss_feeds()
+        except Exception as e:
+            print(f"Error refreshing RSS feeds: {str(e)}")
+        rss_refresh_event.wait(seconds_until_next_poll())
+
+def start_rss_poller():
+    """Starts the background RSS poller once per process."""
+    global rss_poller_thread
+    with rss_poller_lock:
+        if rss_poller_thread is None:
+            try:
+                load_stored_feeds()
+            except sqlite3.Error as e:
+                print(f"Error loading stored RSS feeds: {str(e)}")
+            bump_feed_cache_generation()
+        if rss_poller_thread is None or not rss_poller_thread.is_alive():
+            rss_poller_thread = threading.Thread(target=rss_poller, name='rss-poller', daemon=True)
+            rss_poller_thread.start()
+
+def request_rss_refresh():
+    """Wakes the poller so it picks up newly added or newly due feeds immediately."""
+    rss_refresh_event.set()
+
+@app.before_request
+def ensure_rss_poller():
+    """Lazily starts the RSS poller in the process that actually serves requests."""
+    if rss_poller_thread is None:
+        start_rss_poller()
+
+@app.template_filter('relative_time')
+def relative_time(timestamp):
+    """Formats a UNIX timestamp relative to now, e.g. '5 min ago' or 'in 2 h'."""
+    if not timestamp:
+        return 'never'
+    delta = timestamp - time.time()
+    seconds = abs(delta)
+    if seconds < 60:
+        amount = 'less than a minute' if seconds >= 1 else 'now'
+    elif seconds < 3600:
+        amount = f"{int(seconds // 60)} min"
+    elif seconds < 86400:
+        amount = f"{seconds / 3600:.1f} h"
+    else:
+        amount = f"{seconds / 86400:.1f} days"
+    if amount == 'now':
+        return amount
+    return f"in {amount}" if delta > 0 else f"{amount} ago"
 
 @app.teardown_appcontext
 def teardown_config(exception):
     """Closes the config on app context teardown."""
     g.pop('config', None)
 
+# --- HTTP Caching and Compression ---
+
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'application/xml')
+ENCODING_SUFFIXES = {'br': '-br', 'gzip': '-gzip'}
+
+# Compressed bodies keyed by (path and query, strong ETag, encoding). Feed ETags
+# describe the cache state rather than the bytes, so the path is part of the key.
+compressed_bodies = collections.OrderedDict()
+compressed_bodies_lock = threading.Lock()
+COMPRESSED_BODIES_MAX = 64
+
+def matching_etag(tag):
+    """Returns the If-None-Match tag naming `tag` in any content encoding, or None."""
+    for suffix in ('', *ENCODING_SUFFIXES.values()):
+        if request.if_none_match.contains(tag + suffix):
+            return tag + suffix
+    return None
+
+def not_modified(tag):
+    """Returns a 304 response if the client already has the representation tagged `tag`, else None."""
+    matched = matching_etag(tag)
+    if matched is None:
+        return None
+    response = Response(status=304)
+    response.set_etag(matched)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.vary.add('Accept-Encoding')
+    return response
+
+def with_etag(response, tag):
+    """Tags a response so clients revalidate it with If-None-Match."""
+    response.set_etag(tag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def compress(body, encoding):
+    """Compresses a response body with brotli or gzip."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=app.config['COMPRESS_LEVEL'])
+    return gzip.compress(body, compresslevel=app.config['COMPRESS_LEVEL'], mtime=0)
+
+@app.after_request
+def compress_response(response):
+    """Compresses text and JSON responses for clients that accept brotli or gzip."""
+    if (request.method != 'GET' or response.status_code != 200 or response.direct_passthrough
+            or response.is_streamed or 'Content-Encoding' in response.headers
+            or not response.mimetype.startswith(COMPRESSIBLE_TYPES)):
+        return response
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    if len(body) < app.config['COMPRESS_MIN_SIZE']:
+        return response
+    if brotli is not None and request.accept_encodings['br']:
+        encoding = 'br'
+    elif request.accept_encodings['gzip']:
+        encoding = 'gzip'
+    else:
+        return response
+
+    etag, weak = response.get_etag()
+    key = (request.full_path, etag, encoding) if etag and not weak else None
+    with compressed_bodies_lock:
+        compressed = compressed_bodies.get(key) if key else None
+    if compressed is None:
+        compressed = compress(body, encoding)
+        if key:
+            with compressed_bodies_lock:
+                compressed_bodies[key] = compressed
+                while len(compressed_bodies) > COMPRESSED_BODIES_MAX:
+                    compressed_bodies.popitem(last=False)
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    if key:
+        # A strong ETag identifies one encoding of the body
+        response.set_etag(etag + ENCODING_SUFFIXES[encoding])
+    return response
+
 # --- Routes ---
 
+# Rendered dashboard HTML for the latest config snapshot and feed cache
+# generation, one page per login state. The page depends only on those and the
+# session, so it is reused until the config or a feed changes.
+dashboard_cache = {'config': None, 'generation': None, 'pages': {}}
+dashboard_cache_lock = threading.Lock()
+
+def dashboard_feed_snapshot(config):
+    """Returns the feeds and latest articles the dashboard would otherwise fetch, built from the cache.
+
+    Returns None if any feed has not been fetched yet or is too stale to
+    show, in which case the dashboard fetches them itself. `event_id` is read
+    first, so the events after it cover anything newer than the snapshot.
+    """
+    feeds = config.get('rss_feeds', [])
+    if not feeds:
+        return None
+    event_id = current_rss_event_id()
+    now = time.time()
+    results = []
+    for feed in feeds:
+        data = get_cached_feed(feed['url'])
+        if data is None or now - data['fetched_at'] > app.config['RSS_MAX_STALENESS']:
+            return None
+        if now >= feed_fresh_until(data, get_feed_state(feed['url'])['interval']):
+            revalidate_in_background(feed)
+        results.append((feed, data, 'ok'))
+    try:
+        articles = latest_articles_from(results)
+    except sqlite3.Error as e:
+        print(f"Error reading latest articles for the dashboard: {str(e)}")
+        return None
+    return {
+        'feeds': [feed_payload(feed, data, status) for feed, data, status in results],
+        'articles': articles,
+        'event_id': event_id
+    }
+
+def render_dashboard(config):
+    """Renders index.html for the current request."""
+    return render_template('index.html', 
+                           groups=config.get('groups', []),
+                           dashboard_title=config.get('dashboard_title', 'My Dashboard'),
+                           rss_feeds=config.get('rss_feeds', []),
+                           rss_snapshot=dashboard_feed_snapshot(config))
+
+def cached_dashboard(config, logged_in):
+    """Returns index.html and its ETag, reusing the page rendered for the same config, feeds and login state."""
+    # Read before rendering, so the cached page is never older than its key
+    with feed_cache_lock:
+        generation = feed_cache_generation
+    with dashboard_cache_lock:
+        cached_config = dashboard_cache['config']
+        if (cached_config is not config or dashboard_cache['generation'] != generation) and (
+                cached_config is None
+                or (config.version, generation) >= (cached_config.version, dashboard_cache['generation'])):
+            dashboard_cache.update(config=config, generation=generation, pages={})
+        cacheable = dashboard_cache['config'] is config and dashboard_cache['generation'] == generation
+        page = dashboard_cache['pages'].get(logged_in) if cacheable else None
+    if page is None:
+        html = render_dashboard(config)
+        page = (html, hashlib.sha1(html.encode('utf-8')).hexdigest())
+        if cacheable:
+            with dashboard_cache_lock:
+                if dashboard_cache['config'] is config and dashboard_cache['generation'] == generation:
+                    dashboard_cache['pages'][logged_in] = page
+    return page
+
 @app.route('/')
 def index():
     """Renders the main dashboard page."""
     config = get_config()
-    return render_template('index.html', 
-                         groups=config.get('groups', []),
-                         dashboard_title=config.get('dashboard_title', 'My Dashboard'),
-                         rss_feeds=config.get('rss_feeds', []))
+    if '_flashes' in session:
+        # Flashed messages are part of the page and shown once, so render it fresh
+        return render_dashboard(config)
+    html, tag = cached_dashboard(config, bool(session.get('logged_in')))
+    return not_modified(tag) or with_etag(Response(html, mimetype='text/html'), tag)
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -130,9 +2701,12 @@ def settings():
     if os.path.exists(icon_path):
         available_icons = [f for f in os.listdir(icon_path) if os.path.isfile(os.path.join(icon_path, f))]
     
+    rss_feeds = config.get('rss_feeds', [])
     return render_template('settings.html', 
+                           config_version=config.version,
                            groups=config.get('groups', []), 
-                           rss_feeds=config.get('rss_feeds', []),
+                           rss_feeds=rss_feeds,
+                           feed_states={feed['url']: get_feed_state(feed['url']) for feed in rss_feeds},
                            available_icons=available_icons)
 
 # RSS Feed Routes
@@ -142,7 +2716,6 @@ def add_rss_feed():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
 
-    config = get_config()
     feed_name = request.form.get('feed_name')
     feed_url = request.form.get('feed_url')
 
@@ -150,69 +2723,188 @@ def add_rss_feed():
         flash('Feed Name and URL are required fields.', 'danger')
         return redirect(url_for('settings'))
 
-    # Ensure rss_feeds section exists
-    if 'rss_feeds' not in config:
-        config['rss_feeds'] = []
-
-    # Check if feed already exists
-    if any(feed['name'].lower() == feed_name.lower() for feed in config['rss_feeds']):
-        flash('A feed with this name already exists.', 'danger')
-        return redirect(url_for('settings'))
-
-    # Test the RSS feed first
-    test_feed = fetch_rss_feed(feed_url)
-    if not test_feed:
-        flash('Unable to fetch RSS feed. Please check the URL.', 'danger')
-        return redirect(url_for('settings'))
-
     new_feed = {
         "name": feed_name,
         "url": feed_url,
         "last_fetched": None
     }
-    
-    config['rss_feeds'].append(new_feed)
-    save_config(config)
-    flash(f'RSS Feed "{feed_name}" has been added.', 'success')
+
+    # Optional per-feed overrides for the fetch limits
+    try:
+        read_timeout = request.form.get('read_timeout')
+        if read_timeout:
+            new_feed['read_timeout'] = float(read_timeout)
+        max_size_kb = request.form.get('max_size_kb')
+        if max_size_kb:
+            new_feed['max_bytes'] = int(max_size_kb) * 1024
+    except ValueError:
+        flash('Timeout and maximum size must be numbers.', 'danger')
+        return redirect(url_for('settings'))
+
+    try:
+        commit_config_ops([{'op': 'add_feed', 'feed': new_feed}], form_expected_version())
+    except ConfigError as e:
+        flash(str(e), 'danger')
+        return redirect(url_for('settings'))
+
+    # The feed is checked in the background; the settings page shows the result
+    submit_rss_validations([new_feed])
+    request_rss_refresh()
+    flash(f'RSS Feed "{feed_name}" has been added and is being validated.', 'success')
+    return redirect(url_for('settings'))
+
+@app.route('/revalidate_rss_feeds', methods=['POST'])
+def revalidate_rss_feeds():
+    """Handles re-validating every configured RSS feed."""
+    if not session.get('logged_in'):
+        return redirect(url_for('login'))
+
+    feeds = get_config().get('rss_feeds', [])
+    submit_rss_validations(feeds)
+    flash(f'Re-validating {len(feeds)} RSS feed{"s" if len(feeds) != 1 else ""}.', 'success')
+    return redirect(url_for('settings'))
+
+@app.route('/rss_feed_status', methods=['GET'])
+def rss_feed_status():
+    """Gets the validation status of every configured RSS feed."""
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Not authorized'}), 401
+
+    feeds = get_config().get('rss_feeds', [])
+    return jsonify({'feeds': [
+        {'name': feed['name'], 'url': feed['url'], 'validation': get_rss_validation(feed['url'])}
+        for feed in feeds
+    ]})
+
+@app.route('/import_opml', methods=['POST'])
+def import_opml():
+    """Handles importing RSS feeds from an uploaded OPML file."""
+    if not session.get('logged_in'):
+        return redirect(url_for('login'))
+
+    opml_file = request.files.get('opml_file')
+    if not opml_file or not opml_file.filename:
+        flash('Please choose an OPML file to import.', 'danger')
+        return redirect(url_for('settings'))
+
+    try:
+        outlines = parse_opml(opml_file.read())
+    except (ET.ParseError, ValueError):
+        flash('The uploaded file is not a valid OPML document.', 'danger')
+        return redirect(url_for('settings'))
+
+    configured_feeds = get_config().get('rss_feeds', [])
+
+    # Skip feeds that are already configured and give clashing names a suffix
+    known_urls = {feed['url'] for feed in configured_feeds}
+    known_names = {feed['name'].lower() for feed in configured_feeds}
+    candidates = []
+    for name, url in outlines:
+        if url in known_urls:
+            continue
+        unique_name, suffix = name, 2
+        while unique_name.lower() in known_names:
+            unique_name = f'{name} ({suffix})'
+            suffix += 1
+        known_urls.add(url)
+        known_names.add(unique_name.lower())
+        candidates.append({"name": unique_name, "url": url, "last_fetched": None})
+
+    if not candidates:
+        flash('No new RSS feeds found in the OPML file.', 'warning')
+        return redirect(url_for('settings'))
+
+    # Feeds still validating at the deadline are added too; the settings page shows how they end up
+    accepted, rejected, pending = [], [], 0
+    for feed, result in validate_rss_feeds(candidates, app.config['RSS_IMPORT_DEADLINE']):
+        if result is None:
+            accepted.append(feed)
+            pending += 1
+        elif result['state'] != 'failed':
+            accepted.append(feed)
+        else:
+            rejected.append(feed['name'])
+
+    if accepted:
+        try:
+            commit_config_ops([{'op': 'add_feed', 'feed': feed} for feed in accepted])
+        except ConfigError as e:
+            flash(f'Import failed: {str(e)}', 'danger')
+            return redirect(url_for('settings'))
+        request_rss_refresh()
+
+    message = f'Imported {len(accepted)} of {len(candidates)} new RSS feeds.'
+    if pending:
+        message += f' {pending} {"is" if pending == 1 else "are"} still being validated.'
+    if rejected:
+        shown = ', '.join(rejected[:5])
+        more = f' and {len(rejected) - 5} more' if len(rejected) > 5 else ''
+        message += f' Failed validation: {shown}{more}.'
+    flash(message, 'success' if accepted else 'danger')
     return redirect(url_for('settings'))
 
+@app.route('/export_opml', methods=['GET'])
+def export_opml():
+    """Downloads the configured RSS feeds as an OPML file."""
+    if not session.get('logged_in'):
+        return redirect(url_for('login'))
+
+    config = get_config()
+    feeds = config.get('rss_feeds', [])
+    html_urls = {}
+    for feed in feeds:
+        cached = get_cached_feed(feed['url'])
+        if cached and cached['link'] != feed['url']:
+            html_urls[feed['url']] = cached['link']
+
+    opml = build_opml(feeds, f"{config.get('dashboard_title', 'Dashboard')} RSS Feeds", html_urls)
+    return Response(opml, mimetype='text/x-opml',
+                    headers={'Content-Disposition': 'attachment; filename=feeds.opml'})
+
 @app.route('/delete_rss_feed', methods=['POST'])
 def delete_rss_feed():
     """Handles deleting an RSS feed."""
     if not session.get('logged_in'):
         return redirect(url_for('login'))
     
-    config = get_config()
     feed_name_to_delete = request.form.get('feed_name')
     
-    if 'rss_feeds' not in config:
-        config['rss_feeds'] = []
-    
-    original_feed_count = len(config['rss_feeds'])
-    config['rss_feeds'] = [feed for feed in config['rss_feeds'] if feed['name'] != feed_name_to_delete]
-
-    if len(config['rss_feeds']) < original_feed_count:
-        save_config(config)
+    try:
+        commit_config_ops([{'op': 'delete_feed', 'feed': feed_name_to_delete}], form_expected_version())
         flash(f'RSS Feed "{feed_name_to_delete}" has been deleted.', 'success')
-    else:
-        flash(f'RSS Feed "{feed_name_to_delete}" not found.', 'danger')
+    except ConfigError as e:
+        flash(str(e), 'danger')
         
     return redirect(url_for('settings'))
 
+def feed_payload(feed, data, status):
+    """Returns what the dashboard shows for one feed, with placeholders if it was never fetched."""
+    if data:
+        return dict(public_feed_data(feed['url'], data), name=feed['name'], status=status)
+    return {
+        'name': feed['name'],
+        'url': feed['url'],
+        'title': feed['name'],
+        'link': feed['url'],
+        'description': '',
+        'entries': [],
+        'status': status
+    }
+
 @app.route('/get_rss_feeds', methods=['GET'])
 def get_rss_feeds():
     """Gets all RSS feeds with their latest entries."""
     config = get_config()
     feeds = config.get('rss_feeds', [])
+    tag = feed_cache_tag(config, 'feeds')
+    results = load_rss_feeds(feeds, app.config['RSS_REQUEST_DEADLINE'])
+    # Only responses built entirely from the cache are described by the tag
+    cacheable = all(status == 'ok' for _, _, status in results)
+    if cacheable and matching_etag(tag):
+        return not_modified(tag)
     
-    feed_data = []
-    for feed in feeds:
-        data = fetch_rss_feed(feed['url'])
-        if data:
-            data['name'] = feed['name']
-            feed_data.append(data)
-    
-    return jsonify({'feeds': feed_data})
+    response = jsonify({'feeds': [feed_payload(feed, data, status) for feed, data, status in results]})
+    return with_etag(response, tag) if cacheable else response
 
 @app.route('/get_rss_feed_page/<int:page>', methods=['GET'])
 def get_rss_feed_page(page):
@@ -224,12 +2916,269 @@ def get_rss_feed_page(page):
         return jsonify({'error': 'Invalid page number'}), 400
     
     feed = feeds[page]
-    data = fetch_rss_feed(feed['url'])
+    tag = feed_cache_tag(config, f'page{page}')
+    feed, data, status = load_rss_feeds([feed], app.config['RSS_REQUEST_DEADLINE'])[0]
+    if data and status == 'ok' and matching_etag(tag):
+        return not_modified(tag)
     if data:
-        data['name'] = feed['name']
-        return jsonify({'feed': data, 'total_feeds': len(feeds), 'current_page': page})
+        response = jsonify({'feed': dict(public_feed_data(feed['url'], data), name=feed['name'], status=status),
+                            'total_feeds': len(feeds), 'current_page': page})
+        return with_etag(response, tag) if status == 'ok' else response
+    
+    if status == 'timeout':
+        return jsonify({'error': 'Feed is still being fetched', 'status': status}), 503
+    return jsonify({'error': 'Failed to fetch feed', 'status': status}), 500
+
+def get_latest_articles_across_feeds():
+    """Gets the latest article from each RSS feed and sorts by publication date."""
+    feeds = get_config().get('rss_feeds', [])
+    return latest_articles_from(load_rss_feeds(feeds, app.config['RSS_REQUEST_DEADLINE']))
+
+def latest_articles_from(results):
+    """Returns the five newest of the latest stored articles of the feeds in `results`."""
+    latest_articles = []
     
-    return jsonify({'error': 'Failed to fetch feed'}), 500
+    for feed, cached_feed, status in results:
+        latest_entry = get_latest_stored_article(feed['url'])
+        if latest_entry:
+            latest_articles.append({
+                'title': latest_entry['title'],
+                'link': latest_entry['link'],
+                'summary': latest_entry['summary'],
+                'published': latest_entry['published'],
+                'feed_name': feed['name'],
+                'feed_url': feed['url'],
+                'feed_link': cached_feed['link'] if cached_feed else feed['url'],
+                'sort_timestamp': latest_entry['published_ts']
+            })
+    
+    latest_articles.sort(key=lambda x: x['sort_timestamp'], reverse=True)
+    
+    # Remove sort_timestamp before returning
+    for article in latest_articles:
+        del article['sort_timestamp']
+    
+    return latest_articles[:5]
+
+@app.route('/get_latest_articles', methods=['GET'])
+def get_latest_articles():
+    """Gets the latest articles across all RSS feeds."""
+    try:
+        # The tag is read before the articles, so a match means nothing has changed since
+        tag = feed_cache_tag(get_config(), 'latest')
+        if matching_etag(tag):
+            return not_modified(tag)
+        articles = get_latest_articles_across_feeds()
+        return with_etag(jsonify({'articles': articles}), tag)
+    except Exception as e:
+        print(f"Error in get_latest_articles: {str(e)}")
+        return jsonify({'error': 'Failed to fetch latest articles', 'articles': []}), 500
+
+@app.route('/api/events', methods=['GET'])
+def api_events():
+    """Streams new-article and feed-update events to a dashboard as Server-Sent Events.
+
+    Each stream holds its request open, so the number per process is capped.
+    A 204 tells the browser not to reconnect; the dashboard then polls instead.
+    """
+    if not app.config['RSS_EVENT_STREAMS']:
+        return Response(status=204)
+    try:
+        # The first connection from a dashboard page passes the id its inlined snapshot was taken at
+        last_event_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id', ''))
+    except ValueError:
+        last_event_id = None
+    subscriber = subscribe_rss_events(last_event_id)
+    if subscriber is None:
+        return Response(status=204)
+    return Response(stream_rss_events(subscriber), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/articles', methods=['GET'])
+def api_articles():
+    """Gets one page of the article timeline across all RSS feeds."""
+    config = get_config()
+    feeds = config.get('rss_feeds', [])
+    cursor = request.args.get('cursor')
+    tag = feed_cache_tag(config, 'articles')
+
+    try:
+        limit = min(max(int(request.args.get('limit', 20)), 1), 100)
+    except ValueError:
+        return jsonify({'error': 'Invalid limit'}), 400
+    if matching_etag(tag):
+        return not_modified(tag)
+
+    feeds_by_url = {feed['url']: feed for feed in feeds}
+    try:
+        rows, next_cursor = get_article_timeline(list(feeds_by_url), cursor, limit)
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    articles = []
+    for row in rows:
+        cached_feed = get_cached_feed(row['feed_url'])
+        articles.append({
+            'title': row['title'],
+            'link': row['link'],
+            'summary': row['summary'],
+            'published': row['published'],
+            'feed_name': feeds_by_url[row['feed_url']]['name'],
+            'feed_link': cached_feed['link'] if cached_feed else row['feed_url']
+        })
+
+    return with_etag(jsonify({'articles': articles, 'next_cursor': next_cursor}), tag)
+
+# Operations accepted by /api/batch and the fields each one reads
+BATCH_OP_FIELDS = {
+    'add_group': ('id', 'name', 'icon'),
+    'edit_group': ('group', 'name', 'icon'),
+    'delete_group': ('group',),
+    'move_group': ('group', 'direction'),
+    'add_link': ('group', 'link'),
+    'edit_link': ('group', 'link', 'changes'),
+    'delete_link': ('group', 'link'),
+    'move_link': ('group', 'link', 'direction'),
+    'reorder_groups': ('order',),
+    'reorder_links': ('group', 'order'),
+    'add_feed': ('feed',),
+    'edit_feed': ('feed', 'changes'),
+    'delete_feed': ('feed',),
+    'move_feed': ('feed', 'direction'),
+    'reorder_feeds': ('order',)
+}
+
+def batch_strings(value, fields, kind):
+    """Returns the given string fields of a JSON object, raising ConfigError for other types."""
+    if not isinstance(value, dict):
+        raise ConfigError(f'{kind} must be an object.')
+    strings = {}
+    for field in fields:
+        if value.get(field) is not None:
+            if not isinstance(value[field], str):
+                raise ConfigError(f'{kind} field "{field}" must be a string.')
+            strings[field] = value[field]
+    return strings
+
+def batch_feed(value, kind='Feed'):
+    """Builds a feed entry, or the changed fields of one, as the add RSS feed form does."""
+    feed = batch_strings(value, ('name', 'url'), kind)
+    for field, convert in (('connect_timeout', float), ('read_timeout', float), ('max_bytes', int)):
+        option = value.get(field)
+        if option is not None:
+            if isinstance(option, bool) or not isinstance(option, (int, float)):
+                raise ConfigError(f'{kind} field "{field}" must be a number.')
+            feed[field] = convert(option)
+    return feed
+
+def batch_config_op(op):
+    """Checks one /api/batch operation, returning a copy with only the fields its handler reads."""
+    name = op.get('op') if isinstance(op, dict) else None
+    if name not in BATCH_OP_FIELDS:
+        raise ConfigError(f'Unsupported batch operation: {name!r}.')
+    clean_op = {'op': name}
+    for field in BATCH_OP_FIELDS[name]:
+        value = op.get(field)
+        if value is None:
+            continue
+        if name == 'add_link' and field == 'link':
+            clean_op[field] = batch_strings(value, ('id', 'name', 'url', 'description', 'icon'), 'Link')
+        elif name == 'edit_feed' and field == 'changes':
+            clean_op[field] = batch_feed(value, 'Feed changes')
+        elif field == 'changes':
+            clean_op[field] = batch_strings(value, ('name', 'url', 'description', 'icon'), 'Link changes')
+        elif name == 'add_feed':
+            clean_op[field] = dict(batch_feed(value), last_fetched=None)
+        elif field == 'order':
+            if not isinstance(value, list) or not all(isinstance(item_id, str) for item_id in value):
+                raise ConfigError('Field "order" must be a list of ids.')
+            clean_op[field] = value
+        elif isinstance(value, str):
+            clean_op[field] = value
+        else:
+            raise ConfigError(f'Field "{field}" must be a string.')
+    return clean_op
+
+def json_expected_version(body):
+    """Returns the config version a JSON request was based on, or None if it did not send one."""
+    expected_version = body.get('expected_version')
+    if expected_version is not None and (isinstance(expected_version, bool) or not isinstance(expected_version, int)):
+        raise ConfigError('"expected_version" must be an integer.')
+    return expected_version
+
+@app.route('/api/batch', methods=['POST'])
+def api_batch():
+    """Applies an ordered list of group, link and feed operations as one config change.
+
+    Takes {"ops": [...], "expected_version": N}; either every operation is
+    applied or none is. Returns the new config version and, for each
+    operation, the id of the group or link it added.
+    """
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Not authorized'}), 401
+
+    body = request.get_json(silent=True)
+    ops = body.get('ops') if isinstance(body, dict) else None
+    if not isinstance(ops, list) or not ops:
+        return jsonify({'error': 'Expected a JSON object with a non-empty "ops" list'}), 400
+    if len(ops) > app.config['CONFIG_BATCH_LIMIT']:
+        return jsonify({'error': f'At most {app.config["CONFIG_BATCH_LIMIT"]} operations are allowed per batch'}), 400
+    try:
+        expected_version = json_expected_version(body)
+        clean_ops = []
+        for op_index, op in enumerate(ops):
+            try:
+                # Ids are assigned here so they can be returned to the caller
+                clean_ops.append(with_new_id(batch_config_op(op)))
+            except ConfigError as e:
+                e.op_index = op_index
+                raise
+        config = commit_config_ops(clean_ops, expected_version)
+    except ConfigError as e:
+        return jsonify({'error': str(e), 'index': e.op_index}), e.status
+
+    # Added feeds and feeds given a new url are validated like feeds added from the form
+    new_urls = ({op['feed'].get('url') for op in clean_ops if op['op'] == 'add_feed'}
+                | {op.get('changes', {}).get('url') for op in clean_ops if op['op'] == 'edit_feed'})
+    new_feeds = [feed for feed in config.get('rss_feeds', []) if feed['url'] in new_urls]
+    if new_feeds:
+        submit_rss_validations(new_feeds)
+        request_rss_refresh()
+    ids = [op.get('id') if op['op'] == 'add_group' else op['link']['id'] if op['op'] == 'add_link' else None
+           for op in clean_ops]
+    return jsonify({'success': True, 'version': config.version, 'ids': ids})
+
+@app.route('/api/reorder', methods=['POST'])
+def api_reorder():
+    """Puts the groups, or the links of one group, in a new order given as a complete list of ids.
+
+    Takes {"order": [...]} for groups or {"group": id, "order": [...]} for
+    links, plus an optional "expected_version".
+    """
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Not authorized'}), 401
+
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
+
+    if body.get('group') is None:
+        op = {'op': 'reorder_groups', 'order': body.get('order')}
+    else:
+        op = {'op': 'reorder_links', 'group': body['group'], 'order': body.get('order')}
+    try:
+        config = commit_config_ops([batch_config_op(op)], json_expected_version(body))
+    except ConfigError as e:
+        return jsonify({'error': str(e)}), e.status
+    return jsonify({'success': True, 'version': config.version})
+
+def form_group_ref(name_field='group_name'):
+    """Returns the group a form addresses: its id, or its name from older clients."""
+    return request.form.get('group_id') or request.form.get(name_field)
+
+def form_link_ref(name_field='link_name'):
+    """Returns the link a form addresses: its id, or its name from older clients."""
+    return request.form.get('link_id') or request.form.get(name_field)
 
 # Existing routes continue...
 @app.route('/add_group', methods=['POST'])
@@ -238,7 +3187,6 @@ def add_group():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
 
-    config = get_config()
     group_name = request.form.get('group_name')
     group_icon = request.form.get('group_icon')
 
@@ -246,17 +3194,12 @@ def add_group():
         flash('Group name is required.', 'danger')
         return redirect(url_for('settings'))
 
-    if any(g['name'].lower() == group_name.lower() for g in config['groups']):
-        flash('A group with this name already exists.', 'danger')
+    try:
+        commit_config_ops([{'op': 'add_group', 'name': group_name, 'icon': group_icon}], form_expected_version())
+    except ConfigError as e:
+        flash(str(e), 'danger')
         return redirect(url_for('settings'))
 
-    new_group = {
-        "name": group_name,
-        "icon": group_icon,
-        "links": []
-    }
-    config['groups'].append(new_group)
-    save_config(config)
     flash(f'Group "{group_name}" has been added.', 'success')
     return redirect(url_for('settings'))
 
@@ -266,17 +3209,14 @@ def delete_group():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
     
-    config = get_config()
-    group_name_to_delete = request.form.get('group_name')
+    group_ref = form_group_ref()
     
-    original_group_count = len(config['groups'])
-    config['groups'] = [group for group in config['groups'] if group['name'] != group_name_to_delete]
-
-    if len(config['groups']) < original_group_count:
-        save_config(config)
-        flash(f'Group "{group_name_to_delete}" has been deleted.', 'success')
-    else:
-        flash(f'Group "{group_name_to_delete}" not found.', 'danger')
+    try:
+        group = find_group(get_config(), group_ref)
+        commit_config_ops([{'op': 'delete_group', 'group': group['id']}], form_expected_version())
+        flash(f'Group "{group["name"]}" has been deleted.', 'success')
+    except ConfigError as e:
+        flash(str(e), 'danger')
         
     return redirect(url_for('settings'))
 
@@ -300,24 +3240,14 @@ def save_api_keys():
     if not session.get('logged_in'):
         return jsonify({'error': 'Not authorized'}), 401
 
-    openai_key = request.form.get('openai_api_key')
-    gemini_key = request.form.get('gemini_api_key')
-
-    config = get_config()
-    
-    # Ensure api_keys section exists
-    if 'api_keys' not in config:
-        config['api_keys'] = {
-            'openai_api_key': '',
-            'gemini_api_key': ''
-        }
-
-    if openai_key:
-        config['api_keys']['openai_api_key'] = openai_key
-    if gemini_key:
-        config['api_keys']['gemini_api_key'] = gemini_key
-
-    save_config(config)
+    try:
+        commit_config_ops([{
+            'op': 'set_api_keys',
+            'openai_api_key': request.form.get('openai_api_key'),
+            'gemini_api_key': request.form.get('gemini_api_key')
+        }], form_expected_version())
+    except ConfigError as e:
+        return jsonify({'error': str(e)}), e.status
     return jsonify({'success': True})
 
 @app.route('/change_admin_password', methods=['POST'])
@@ -332,20 +3262,14 @@ def change_admin_password():
     if not current_password or not new_password:
         return jsonify({'error': 'Current password and new password are required'}), 400
 
-    config = get_config()
-    admin_creds = config.get('admin', {})
-
     # Verify current password
-    if current_password != admin_creds.get('password'):
+    if current_password != get_config().get('admin', {}).get('password'):
         return jsonify({'error': 'Current password is incorrect'}), 400
 
-    # Validate new password length
-    if len(new_password) < 4:
-        return jsonify({'error': 'New password must be at least 4 characters long'}), 400
-
-    # Update password in config
-    config['admin']['password'] = new_password
-    save_config(config)
+    try:
+        commit_config_ops([{'op': 'set_admin_password', 'password': new_password}], form_expected_version())
+    except ConfigError as e:
+        return jsonify({'error': str(e)}), e.status
     
     return jsonify({'success': True})
 
@@ -364,18 +3288,10 @@ def save_dashboard_title():
     if not session.get('logged_in'):
         return jsonify({'error': 'Not authorized'}), 401
 
-    dashboard_title = request.form.get('dashboard_title')
-    
-    if not dashboard_title:
-        return jsonify({'error': 'Dashboard title is required'}), 400
-
-    # Validate title length
-    if len(dashboard_title) > 50:
-        return jsonify({'error': 'Dashboard title must be 50 characters or less'}), 400
-
-    config = get_config()
-    config['dashboard_title'] = dashboard_title.strip()
-    save_config(config)
+    try:
+        commit_config_ops([{'op': 'set_title', 'title': request.form.get('dashboard_title')}], form_expected_version())
+    except ConfigError as e:
+        return jsonify({'error': str(e)}), e.status
     
     return jsonify({'success': True})
 
@@ -435,20 +3351,21 @@ def add_link():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
 
-    config = get_config()
-    group_name = request.form.get('group_name')
+    group_ref = form_group_ref()
     link_name = request.form.get('link_name')
     link_url = request.form.get('link_url')
     link_description = request.form.get('link_description')
     icon_file = request.files.get('link_icon')
 
-    if not all([group_name, link_name, link_url]):
+    if not all([group_ref, link_name, link_url]):
         flash('Group, Link Name, and URL are required fields.', 'danger')
         return redirect(url_for('settings'))
 
-    target_group = next((g for g in config['groups'] if g['name'] == group_name), None)
-    if not target_group:
-        flash('Group not found.', 'danger')
+    # Check the group before saving the uploaded icon
+    try:
+        group = find_group(get_config(), group_ref)
+    except ConfigError as e:
+        flash(str(e), 'danger')
         return redirect(url_for('settings'))
 
     icon_filename = None
@@ -465,9 +3382,13 @@ def add_link():
         "icon": icon_filename
     }
     
-    target_group['links'].append(new_link)
-    save_config(config)
-    flash(f'Link "{link_name}" has been added to group "{group_name}".', 'success')
+    try:
+        commit_config_ops([{'op': 'add_link', 'group': group['id'], 'link': new_link}], form_expected_version())
+    except ConfigError as e:
+        flash(str(e), 'danger')
+        return redirect(url_for('settings'))
+
+    flash(f'Link "{link_name}" has been added to group "{group["name"]}".', 'success')
     return redirect(url_for('settings'))
 
 @app.route('/delete_link', methods=['POST'])
@@ -476,24 +3397,18 @@ def delete_link():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
         
-    config = get_config()
-    group_name = request.form.get('group_name')
-    link_name_to_delete = request.form.get('link_name')
-
-    target_group = next((g for g in config['groups'] if g['name'] == group_name), None)
-    
-    if not target_group:
-        flash('Group not found.', 'danger')
-        return redirect(url_for('settings'))
-
-    original_link_count = len(target_group['links'])
-    target_group['links'] = [link for link in target_group['links'] if link['name'] != link_name_to_delete]
+    group_ref = form_group_ref()
+    link_ref = form_link_ref()
 
-    if len(target_group['links']) < original_link_count:
-        save_config(config)
-        flash(f'Link "{link_name_to_delete}" has been deleted from "{group_name}".', 'success')
-    else:
-        flash(f'Link "{link_name_to_delete}" not found in group "{group_name}".', 'danger')
+    try:
+        group, link = find_link(get_config(), group_ref, link_ref)
+        # A name from an older client still removes every link with that name
+        commit_config_ops([{'op': 'delete_link', 'group': group['id'],
+                            'link': link['id'] if request.form.get('link_id') else link_ref}],
+                          form_expected_version())
+        flash(f'Link "{link["name"]}" has been deleted from "{group["name"]}".', 'success')
+    except ConfigError as e:
+        flash(str(e), 'danger')
 
     return redirect(url_for('settings'))
 
@@ -503,28 +3418,18 @@ def edit_group():
     if not session.get('logged_in'):
         return jsonify({'error': 'Not authorized'}), 401
 
-    config = get_config()
-    old_group_name = request.form.get('old_name')
+    group_ref = form_group_ref('old_name')
     new_group_name = request.form.get('new_name')
     new_group_icon = request.form.get('icon')
 
-    if not all([old_group_name, new_group_name]):
+    if not all([group_ref, new_group_name]):
         return jsonify({'error': 'Group names are required'}), 400
 
-    # Find the target group
-    target_group = next((g for g in config['groups'] if g['name'] == old_group_name), None)
-    if not target_group:
-        return jsonify({'error': 'Group not found'}), 404
-
-    # Check if new name conflicts with existing groups (except the current one)
-    if new_group_name.lower() != old_group_name.lower():
-        if any(g['name'].lower() == new_group_name.lower() for g in config['groups']):
-            return jsonify({'error': 'A group with this name already exists'}), 400
-
-    # Update the group
-    target_group['name'] = new_group_name
-    target_group['icon'] = new_group_icon
-    save_config(config)
+    try:
+        commit_config_ops([{'op': 'edit_group', 'group': group_ref,
+                            'name': new_group_name, 'icon': new_group_icon}], form_expected_version())
+    except ConfigError as e:
+        return jsonify({'error': str(e)}), e.status
     return jsonify({'success': True})
 
 @app.route('/edit_link', methods=['POST'])
@@ -533,42 +3438,39 @@ def edit_link():
     if not session.get('logged_in'):
         return jsonify({'error': 'Not authorized'}), 401
 
-    config = get_config()
-    group_name = request.form.get('group_name')
-    old_link_name = request.form.get('old_name')
+    group_ref = form_group_ref()
+    link_ref = form_link_ref('old_name')
     new_link_name = request.form.get('new_name')
     new_link_url = request.form.get('new_url')
     new_link_description = request.form.get('new_description')
     icon_file = request.files.get('new_icon')
 
-    if not all([group_name, old_link_name, new_link_name, new_link_url]):
-        return jsonify({'error': 'Group name, old link name, new link name, and URL are required'}), 400
-
-    # Find the target group
-    target_group = next((g for g in config['groups'] if g['name'] == group_name), None)
-    if not target_group:
-        return jsonify({'error': 'Group not found'}), 404
-
-    # Find the target link
-    target_link = next((l for l in target_group['links'] if l['name'] == old_link_name), None)
-    if not target_link:
-        return jsonify({'error': 'Link not found'}), 404
+    if not all([group_ref, link_ref, new_link_name, new_link_url]):
+        return jsonify({'error': 'Group, link, new link name, and URL are required'}), 400
 
-    # Handle icon upload if provided
-    icon_filename = target_link.get('icon')  # Keep existing icon by default
+    # Check the link exists before saving the uploaded icon
+    try:
+        group, link = find_link(get_config(), group_ref, link_ref)
+    except ConfigError as e:
+        return jsonify({'error': str(e)}), e.status
+
+    changes = {
+        'name': new_link_name,
+        'url': new_link_url,
+        'description': new_link_description
+    }
+    # Keep the existing icon unless a new one was uploaded
     if icon_file and allowed_file(icon_file.filename):
         filename = secure_filename(icon_file.filename)
         save_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
         icon_file.save(save_path)
-        icon_filename = filename
+        changes['icon'] = filename
 
-    # Update the link
-    target_link['name'] = new_link_name
-    target_link['url'] = new_link_url
-    target_link['description'] = new_link_description
-    target_link['icon'] = icon_filename
-    
-    save_config(config)
+    try:
+        commit_config_ops([{'op': 'edit_link', 'group': group['id'], 'link': link['id'], 'changes': changes}],
+                          form_expected_version())
+    except ConfigError as e:
+        return jsonify({'error': str(e)}), e.status
     return jsonify({'success': True})
 
 @app.route('/move_group', methods=['POST'])
@@ -577,31 +3479,19 @@ def move_group():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
 
-    config = get_config()
-    group_name = request.form.get('group_name')
+    group_ref = form_group_ref()
     direction = request.form.get('direction')  # 'up' or 'down'
 
-    if not all([group_name, direction]):
-        flash('Group name and direction are required.', 'danger')
+    if not all([group_ref, direction]):
+        flash('Group and direction are required.', 'danger')
         return redirect(url_for('settings'))
 
-    # Find the group index
-    group_index = next((i for i, g in enumerate(config['groups']) if g['name'] == group_name), None)
-    if group_index is None:
-        flash('Group not found.', 'danger')
-        return redirect(url_for('settings'))
-
-    # Move the group
-    if direction == 'up' and group_index > 0:
-        config['groups'][group_index], config['groups'][group_index - 1] = config['groups'][group_index - 1], config['groups'][group_index]
-        save_config(config)
-        flash(f'Group "{group_name}" moved up.', 'success')
-    elif direction == 'down' and group_index < len(config['groups']) - 1:
-        config['groups'][group_index], config['groups'][group_index + 1] = config['groups'][group_index + 1], config['groups'][group_index]
-        save_config(config)
-        flash(f'Group "{group_name}" moved down.', 'success')
-    else:
-        flash('Cannot move group in that direction.', 'warning')
+    try:
+        group = find_group(get_config(), group_ref)
+        commit_config_ops([{'op': 'move_group', 'group': group['id'], 'direction': direction}], form_expected_version())
+        flash(f'Group "{group["name"]}" moved {direction}.', 'success')
+    except ConfigError as e:
+        flash(str(e), 'warning')
 
     return redirect(url_for('settings'))
 
@@ -611,38 +3501,21 @@ def move_link():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
 
-    config = get_config()
-    group_name = request.form.get('group_name')
-    link_name = request.form.get('link_name')
+    group_ref = form_group_ref()
+    link_ref = form_link_ref()
     direction = request.form.get('direction')  # 'up' or 'down'
 
-    if not all([group_name, link_name, direction]):
-        flash('Group name, link name, and direction are required.', 'danger')
-        return redirect(url_for('settings'))
-
-    # Find the target group
-    target_group = next((g for g in config['groups'] if g['name'] == group_name), None)
-    if not target_group:
-        flash('Group not found.', 'danger')
+    if not all([group_ref, link_ref, direction]):
+        flash('Group, link, and direction are required.', 'danger')
         return redirect(url_for('settings'))
 
-    # Find the link index
-    link_index = next((i for i, l in enumerate(target_group['links']) if l['name'] == link_name), None)
-    if link_index is None:
-        flash('Link not found.', 'danger')
-        return redirect(url_for('settings'))
-
-    # Move the link
-    if direction == 'up' and link_index > 0:
-        target_group['links'][link_index], target_group['links'][link_index - 1] = target_group['links'][link_index - 1], target_group['links'][link_index]
-        save_config(config)
-        flash(f'Link "{link_name}" moved up.', 'success')
-    elif direction == 'down' and link_index < len(target_group['links']) - 1:
-        target_group['links'][link_index], target_group['links'][link_index + 1] = target_group['links'][link_index + 1], target_group['links'][link_index]
-        save_config(config)
-        flash(f'Link "{link_name}" moved down.', 'success')
-    else:
-        flash('Cannot move link in that direction.', 'warning')
+    try:
+        group, link = find_link(get_config(), group_ref, link_ref)
+        commit_config_ops([{'op': 'move_link', 'group': group['id'], 'link': link['id'], 'direction': direction}],
+                          form_expected_version())
+        flash(f'Link "{link["name"]}" moved {direction}.', 'success')
+    except ConfigError as e:
+        flash(str(e), 'warning')
 
     return redirect(url_for('settings'))
 
@@ -654,60 +3527,3 @@ if __name__ == '__main__':
         os.makedirs(os.path.join(app.static_folder, 'icons'))
         
     app.run(debug=True, host='0.0.0.0', port=5066)
-def get_latest_articles_across_feeds():
-    """Gets the latest article from each RSS feed and sorts by publication date."""
-    config = get_config()
-    feeds = config.get('rss_feeds', [])
-    
-    latest_articles = []
-    
-    for feed in feeds:
-        try:
-            parsed_feed = feedparser.parse(feed['url'])
-            if parsed_feed.entries:
-                latest_entry = parsed_feed.entries[0]
-                
-                pub_date = None
-                if hasattr(latest_entry, 'published_parsed') and latest_entry.published_parsed:
-                    try:
-                        pub_date = datetime(*latest_entry.published_parsed[:6])
-                    except:
-                        pub_date = datetime.now()
-                elif hasattr(latest_entry, 'updated_parsed') and latest_entry.updated_parsed:
-                    try:
-                        pub_date = datetime(*latest_entry.updated_parsed[:6])
-                    except:
-                        pub_date = datetime.now()
-                else:
-                    pub_date = datetime.now()
-                
-                article = {
-                    'title': getattr(latest_entry, 'title', 'Untitled'),
-                    'link': getattr(latest_entry, 'link', ''),
-                    'summary': getattr(latest_entry, 'summary', getattr(latest_entry, 'description', ''))[:150] + '...' if getattr(latest_entry, 'summary', getattr(latest_entry, 'description', '')) else '',
-                    'published': getattr(latest_entry, 'published', ''),
-                    'feed_name': feed['name'],
-                    'feed_link': getattr(parsed_feed.feed, 'link', feed['url']),
-                    'sort_timestamp': pub_date.timestamp()
-                }
-                latest_articles.append(article)
-        except Exception as e:
-            print(f"Error fetching latest from {feed['name']}: {str(e)}")
-    
-    latest_articles.sort(key=lambda x: x['sort_timestamp'], reverse=True)
-    
-    # Remove sort_timestamp before returning
-    for article in latest_articles:
-        del article['sort_timestamp']
-    
-    return latest_articles[:5]
-
-@app.route('/get_latest_articles', methods=['GET'])
-def get_latest_articles():
-    """Gets the latest articles across all RSS feeds."""
-    try:
-        articles = get_latest_articles_across_feeds()
-        return jsonify({'articles': articles})
-    except Exception as e:
-        print(f"Error in get_latest_articles: {str(e)}")
-        return jsonify({'error': 'Failed to fetch latest articles', 'articles': []}), 500